@@ -1,19 +1,24 @@
 import json
 import os
 
-import librosa
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
 
 from data.model.output_models.intonation_data import Intonation
+from data.model.output_models.time_range import TimeRange
 from data.model.output_models.transcription_response import Transcription
 from data.model.output_models.user_success_rate import UserSuccessRate
 from service.accent_analysis_service import AccentAnalysisService
 from service.audio_service import AudioService
+from service.chunked_transcription_service import ChunkedTranscriptionService
+from service.compute_executor import ComputeExecutor
 from service.intonation_analysis_service import IntonationAnalysisService
+from service.ingest_pipeline import IngestPipeline
+from service.job_registry import JobRegistry
+from service.lesson_store import LessonFiles, LessonStore
+from service.media_stream import GrowingFileStream
 from service.pause_analysis_service import PauseAnalysisService
 from service.pronunciation_analysis_service import PronunciationAnalysisService
-from service.thread_helper import ThreadHelper
 from data.remote_data_source.transcription_remote_data_source import TranscriptService
 from service.words_analysis_service import WordsAnalysisService
 from service.youtube_downloader import YouTubeDownloader
@@ -21,29 +26,34 @@ from utils.file_data_manager import FileDataManager
 
 
 class FlaskAppWrapper:
-    def __init__(self):
+    def __init__(self, analysis_sample_rate=AudioService.ANALYSIS_SAMPLE_RATE, cpu_workers=None, io_workers=None,
+                 chunked_transcription=True):
         self.app = Flask(__name__)
         CORS(self.app)
 
+        self.executor = ComputeExecutor.configure(cpu_workers, io_workers)
+        self.job_registry = JobRegistry(self.executor)
+
         self.transcript_service = TranscriptService()
+        self.chunked_transcription_service = ChunkedTranscriptionService(self.transcript_service, self.executor)
+        self.chunked_transcription = chunked_transcription
         self.words_analysis_service = WordsAnalysisService()
-        self.intonation_analysis_service = IntonationAnalysisService()
-        self.accent_analysis_service = AccentAnalysisService()
+        self.intonation_analysis_service = IntonationAnalysisService(executor=self.executor)
+        self.accent_analysis_service = AccentAnalysisService(executor=self.executor)
         self.pronunciation_analysis_service = PronunciationAnalysisService()
         self.pause_analysis_service = PauseAnalysisService()
         self.youtube_downloader = YouTubeDownloader()
         self.file_manager = FileDataManager()
         self.audio_service = AudioService()
+        self.lesson_store = LessonStore()
+        self.analysis_sample_rate = analysis_sample_rate
 
-        self.user_audio_file_path = os.path.join('./user_files', 'user_audio.wav')
+        self.user_audio_file_path = os.path.abspath(os.path.join('./user_files', 'user_audio.wav'))
         self.user_words_file_path = os.path.join('./user_files', 'user_transcription.json')
         self.current_time_range_file_path = os.path.join('./user_files', 'current_time_range.json')
         os.makedirs('./user_files', exist_ok=True)
 
-        self.lector_audio_file_path = os.path.join('./lector_files', 'lector_audio.mp3')
-        self.lector_audio_file_path_wav = os.path.join('./lector_files', 'lector_audio.wav')
-        self.lector_words_file_path = os.path.join('./lector_files', 'lector_words.json')
-        self.video_file_path = os.path.join('./lector_files', 'lector_video.mp4')
+        self.lector_files = LessonFiles('./lector_files')
         os.makedirs('./lector_files', exist_ok=True)
 
         self.setup_routes()
@@ -54,33 +64,55 @@ class FlaskAppWrapper:
             youtube_url = request.args.get('youtube_url')
             print("upload video url:")
             print(youtube_url)
-            self.youtube_downloader.download_youtube_video(youtube_url)
-
-            content_length = os.path.getsize(self.video_file_path)
-            content_length_str = str(content_length)
-
-            response = send_file(self.video_file_path, mimetype='video/mp4')
-            response.headers['Content-Length'] = content_length_str
-            return response
+            try:
+                lector_files, ingest_future = self.lesson_store.start(
+                    self.lesson_store.get_video_id(youtube_url), LessonStore.VIDEO_ARTIFACT,
+                    lambda lesson_files: self.ingest_lesson_video(youtube_url, lesson_files), self.executor.submit_io)
+                if not ingest_future.done():
+                    video_stream = GrowingFileStream(lector_files.partial_file_path(LessonStore.VIDEO_ARTIFACT),
+                                                     ingest_future)
+                    if video_stream.open() and not ingest_future.done():
+                        return Response(video_stream, mimetype='video/mp4', headers={'Cache-Control': 'no-store'})
+                    video_stream.close()
+                ingest_future.result()
+            except Exception as e:
+                print(f"Lesson video ingest error: {e}")
+                return jsonify({"message": "Wideo nie zostało pobrane"}), 500
+
+            return send_file(lector_files.video_file_path, mimetype='video/mp4', conditional=True)
 
         @self.app.route('/api/pauses_timestamps', methods=['GET'])
         def get_timestamps():
             youtube_url = request.args.get('youtube_url')
             print("upload audio url:")
             print(youtube_url)
-            self.youtube_downloader.download_youtube_audio(youtube_url)
-            self.audio_service.convert_mp3_to_wav(self.lector_audio_file_path)
+            try:
+                video_id = self.lesson_store.get_video_id(youtube_url)
+                lector_files = self.lesson_store.ensure(video_id, LessonStore.AUDIO_ARTIFACT,
+                                                        lambda lesson_files: self.ingest_lesson_audio(youtube_url,
+                                                                                                      video_id,
+                                                                                                      lesson_files))
+            except Exception as e:
+                print(f"Lesson audio ingest error: {e}")
+                return jsonify({"message": "Transkrypt nie został pobrany"}), 500
 
-            lector_transcription = self.transcript_service.get_transcript_data_from_deepgram(
-                self.lector_audio_file_path)
+            self.lector_files = lector_files
+            pause_times_in_millis = self.file_manager.load_pauses_from_file(lector_files.pauses_file_path)
 
-            lector_words = lector_transcription.results.channels[0].alternatives[0].words
+            return jsonify(pause_times_in_millis)
 
-            pause_times_in_millis = self.pause_analysis_service.get_pauses(lector_words)
+        @self.app.route('/api/ingest_timings', methods=['GET'])
+        def get_ingest_timings():
+            youtube_url = request.args.get('youtube_url')
+            try:
+                lector_files = self.lesson_store.get_lesson_files(self.lesson_store.get_video_id(youtube_url))
+            except Exception as e:
+                print(f"Ingest timings error: {e}")
+                return jsonify({"message": "Nieprawidłowy adres wideo"}), 400
 
-            self.file_manager.save_words_to_file(lector_words, self.lector_words_file_path)
-
-            return jsonify(pause_times_in_millis)
+            if not os.path.exists(lector_files.ingest_timings_file_path):
+                return jsonify({"message": "Nie znaleziono czasów przetwarzania"}), 404
+            return jsonify(self.file_manager.load_ingest_timings_from_file(lector_files.ingest_timings_file_path))
 
         @self.app.route('/api/upload_audio', methods=['POST'])
         def upload_audio():
@@ -90,41 +122,74 @@ class FlaskAppWrapper:
 
                 self.file_manager.save_audio_to_wav(audio, self.user_audio_file_path)
 
+            time_range = None
             if 'timeRange' in request.form:
                 time_range_json = request.form['timeRange']
-                time_range = json.loads(time_range_json)
-                self.file_manager.save_time_range_to_file(time_range, self.current_time_range_file_path)
-
-            user_transcript = self.transcript_service.get_transcript_data_from_deepgram(
-                self.user_audio_file_path)
-            if not user_transcript:
+                time_range_data = json.loads(time_range_json)
+                self.file_manager.save_time_range_to_file(time_range_data, self.current_time_range_file_path)
+                time_range = TimeRange(**time_range_data)
+            elif os.path.exists(self.current_time_range_file_path):
+                time_range = self.file_manager.load_time_range_from_file(self.current_time_range_file_path)
+
+            user_audio, usr = self.audio_service.load_analysis_audio(self.user_audio_file_path,
+                                                                     self.analysis_sample_rate)
+
+            try:
+                user_transcript = self.transcript_service.get_transcript_data_from_deepgram(
+                    self.user_audio_file_path)
+            except TimeoutError as e:
+                print(f"User transcription timeout: {e}")
+                return jsonify({"message": "Transkrypt nie został pobrany w wymaganym czasie"}), 504
+            except Exception as e:
+                print(f"User transcription error: {e}")
                 return jsonify({"message": "Transkrypt nie został pobrany"}), 500
 
             user_words = user_transcript.results.channels[0].alternatives[0].words
             self.file_manager.save_words_to_file(user_words, self.user_words_file_path)
 
-            return jsonify({"message": "Plik audio został zapisany poprawnie"}), 200
+            pronunciation_job_id = None
+            if time_range is not None:
+                pronunciation_job_id = self.job_registry.submit(self.calculate_pronunciation_accuracy,
+                                                                self.lector_files, time_range, user_words, user_audio,
+                                                                usr)
+            else:
+                print("No time range for pronunciation analysis")
+
+            return jsonify({"message": "Plik audio został zapisany poprawnie",
+                            "pronunciationJobId": pronunciation_job_id}), 200
+
+        @self.app.route('/api/pronunciation_result', methods=['GET'])
+        def get_pronunciation_result():
+            job_id = request.args.get('job_id')
+            status, pronunciation_accuracy = self.job_registry.get_status(job_id)
+
+            if status is None:
+                return jsonify({"message": "Nie znaleziono zadania"}), 404
+            if status == JobRegistry.PENDING:
+                return jsonify({"status": status}), 202
+            if status == JobRegistry.FAILED:
+                return jsonify({"status": status}), 500
+            return jsonify({"status": status, "pronunciationAccuracy": pronunciation_accuracy}), 200
 
         @self.app.route('/api/get_user_audio', methods=['GET'])
         def get_user_audio():
-            response = send_file(self.user_audio_file_path, mimetype='audio/wav')
-            return response
+            return send_file(self.user_audio_file_path, mimetype='audio/wav', conditional=True)
 
         @self.app.route('/api/get_user_success_rate', methods=['GET'])
         def get_user_success_rate():
+            pronunciation_job_id = request.args.get('pronunciation_job_id')
 
             time_range = self.file_manager.load_time_range_from_file(self.current_time_range_file_path)
+            lector_files = self.lector_files
 
             lector_words = self.words_analysis_service.get_lector_words_for_time_range(time_range.start, time_range.end,
-                                                                                       self.lector_words_file_path)
+                                                                                       lector_files.words_file_path)
 
             user_words = self.file_manager.load_words_from_file(self.user_words_file_path)
 
-            lector_audio, lsr = self.audio_service.load_audio_segment(self.lector_audio_file_path_wav, time_range.start,
-                                                                      time_range.end)
-            user_audio, usr = librosa.load(self.user_audio_file_path, sr=None)
-
-            helper = ThreadHelper()
+            lector_audio, lsr = self.load_lector_analysis_segment(lector_files, time_range)
+            user_audio, usr = self.audio_service.load_analysis_audio(self.user_audio_file_path,
+                                                                     self.analysis_sample_rate)
 
             def get_accent_data():
                 accent_differences = self.accent_analysis_service.compare_accents(lector_audio, lsr, time_range,
@@ -137,8 +202,9 @@ class FlaskAppWrapper:
                 return accent_differences, accent_accuracy
 
             def get_intonation_data():
+                lector_pitch = self.load_lector_pitch(lector_files, time_range)
                 lector_intonation, user_intonation, intonation_accuracy = self.intonation_analysis_service.get_intonation_success_rate(
-                    lector_audio, user_audio)
+                    lector_audio, lsr, user_audio, usr, lector_pitch)
                 print("got intonation data")
                 return lector_intonation, user_intonation, intonation_accuracy
 
@@ -149,33 +215,126 @@ class FlaskAppWrapper:
                 return words_accuracy, Transcription(lector_transcription=lector_transcription,
                                                      user_transcription=user_transcription)
 
-            def get_pronunciation_data():
-                _, pronunciation_accuracy = self.pronunciation_analysis_service.compare_vowels_pronunciation(
-                    self.user_audio_file_path, self.lector_audio_file_path_wav, time_range, user_words, lector_words)
-                return pronunciation_accuracy
+            accent_future = self.executor.submit_io(get_accent_data)
+            intonation_future = self.executor.submit_io(get_intonation_data)
+            transcription_future = self.executor.submit_cpu(get_transcription_data)
 
-            helper.run_in_threads(get_accent_data, [], 'accent_data')
-            helper.run_in_threads(get_intonation_data, [], 'intonation_data')
-            helper.run_in_threads(get_transcription_data, [], 'transcription_data')
-            #helper.run_in_threads(get_pronunciation_data, [], 'pronunciation_data')
-
-            helper.wait_for_completion()
+            accent_differences, accent_accuracy = accent_future.result()
+            lector_intonation, user_intonation, intonation_accuracy = intonation_future.result()
+            words_accuracy, transcription_data = transcription_future.result()
             print("threads completed")
 
-            accent_differences, accent_accuracy = helper.results['accent_data']
-            lector_intonation, user_intonation, intonation_accuracy = helper.results['intonation_data']
-            words_accuracy, transcription_data = helper.results['transcription_data']
-            #pronunciation_accuracy = helper.results['pronunciation_data']
-
-            helper.threads.clear()
+            _, pronunciation_accuracy = self.job_registry.get_status(pronunciation_job_id)
 
             user_success_rate = UserSuccessRate(words_accuracy, transcription_data, accent_accuracy,
                                                 accent_differences, intonation_accuracy,
                                                 Intonation(lector_intonation=lector_intonation,
-                                                           user_intonation=user_intonation), 0.6)
+                                                           user_intonation=user_intonation), pronunciation_accuracy,
+                                                pronunciation_job_id)
 
             return user_success_rate.to_json(), 200, {'Content-Type': 'application/json'}
 
+    def calculate_pronunciation_accuracy(self, lector_files, time_range, user_words, user_audio, usr):
+        lector_words = self.words_analysis_service.get_lector_words_for_time_range(time_range.start, time_range.end,
+                                                                                   lector_files.words_file_path)
+        lector_audio, lsr = self.load_lector_analysis_segment(lector_files, time_range)
+
+        _, pronunciation_accuracy = self.pronunciation_analysis_service.compare_vowels_pronunciation(
+            user_audio, usr, lector_audio, lsr, time_range, user_words, lector_words)
+        print("got pronunciation data")
+        return pronunciation_accuracy
+
+    def ingest_lesson_video(self, youtube_url, lector_files):
+        partial_file_path = lector_files.partial_file_path(LessonStore.VIDEO_ARTIFACT)
+        if self.youtube_downloader.download_youtube_video(youtube_url, os.path.basename(partial_file_path),
+                                                          lector_files.directory) is None:
+            raise RuntimeError("Lesson video download failed")
+        os.replace(partial_file_path, lector_files.video_file_path)
+
+    def ingest_lesson_audio(self, youtube_url, video_id, lector_files):
+        pipeline = IngestPipeline(self.executor)
+        pipeline.add_stage('video', lambda: self.lesson_store.ensure(
+            video_id, LessonStore.VIDEO_ARTIFACT, lambda lesson_files: self.ingest_lesson_video(youtube_url,
+                                                                                             lesson_files)))
+        pipeline.add_stage('wav', lambda _: self.audio_service.extract_wav(lector_files.video_file_path,
+                                                                           lector_files.audio_file_path_wav),
+                           dependencies=['video'])
+        pipeline.add_stage('analysis_audio', lambda _: self.save_lector_analysis_audio(lector_files),
+                           dependencies=['wav'], kind=IngestPipeline.CPU_STAGE)
+        pipeline.add_stage('pitch', lambda _: self.save_lector_pitch_track(lector_files),
+                           dependencies=['analysis_audio'], kind=IngestPipeline.CPU_STAGE, background=True)
+        if self.chunked_transcription:
+            pipeline.add_stage('transcription', lambda lector_audio: self.get_lector_words(lector_files, lector_audio),
+                               dependencies=['analysis_audio'])
+        else:
+            pipeline.add_stage('transcription', lambda _: self.get_lector_words(lector_files, None),
+                               dependencies=['wav'])
+        pipeline.add_stage('pauses', lambda lector_words: self.save_lector_pauses(lector_files, lector_words),
+                           dependencies=['transcription'])
+
+        try:
+            pipeline.run()
+        finally:
+            self.save_ingest_timings(pipeline, lector_files)
+
+        pitch_future = pipeline.background_futures.get('pitch')
+        if pitch_future is not None:
+            pitch_future.add_done_callback(lambda future: self.save_background_stage_result(future, pipeline,
+                                                                                            lector_files))
+
+    def save_ingest_timings(self, pipeline, lector_files):
+        self.file_manager.save_ingest_timings_to_file(pipeline.get_timings(), lector_files.ingest_timings_file_path)
+
+    def save_background_stage_result(self, future, pipeline, lector_files):
+        if future.exception() is not None:
+            print(f"Lesson pitch precompute error: {future.exception()}")
+        self.save_ingest_timings(pipeline, lector_files)
+
+    def save_lector_pauses(self, lector_files, lector_words):
+        pause_times_in_millis = self.pause_analysis_service.get_pauses(lector_words)
+        self.file_manager.save_words_to_file(lector_words, lector_files.words_file_path)
+        self.file_manager.save_pauses_to_file(pause_times_in_millis, lector_files.pauses_file_path)
+
+    def save_lector_analysis_audio(self, lector_files):
+        lector_audio, _ = self.audio_service.load_analysis_audio(lector_files.audio_file_path_wav,
+                                                                 self.analysis_sample_rate)
+        self.file_manager.save_analysis_audio(lector_audio, lector_files.analysis_audio_file_path)
+        return lector_audio
+
+    def get_lector_words(self, lector_files, lector_audio):
+        if self.chunked_transcription:
+            return self.chunked_transcription_service.get_words(lector_files.audio_file_path_wav, lector_audio,
+                                                                self.analysis_sample_rate)
+
+        lector_transcription = self.transcript_service.get_lector_transcript_data_from_deepgram(
+            lector_files.audio_file_path_wav)
+        return lector_transcription.results.channels[0].alternatives[0].words
+
+    def load_lector_analysis_segment(self, lector_files, time_range):
+        if not os.path.exists(lector_files.analysis_audio_file_path):
+            return self.audio_service.load_audio_segment(lector_files.audio_file_path_wav, time_range.start,
+                                                         time_range.end, self.analysis_sample_rate)
+
+        lector_audio = self.file_manager.load_analysis_audio_segment(lector_files.analysis_audio_file_path,
+                                                                     self.analysis_sample_rate, time_range.start,
+                                                                     time_range.end)
+        return lector_audio, self.analysis_sample_rate
+
+    def save_lector_pitch_track(self, lector_files):
+        if os.path.exists(lector_files.pitch_file_path):
+            os.remove(lector_files.pitch_file_path)
+
+        lector_audio = self.file_manager.load_analysis_audio(lector_files.analysis_audio_file_path)
+        times, f0 = self.intonation_analysis_service.get_lesson_pitch_track(lector_audio, self.analysis_sample_rate)
+        self.file_manager.save_pitch_track(times, f0, lector_files.pitch_file_path)
+
+    def load_lector_pitch(self, lector_files, time_range):
+        if not os.path.exists(lector_files.pitch_file_path):
+            return None
+
+        times, f0 = self.file_manager.load_pitch_track(lector_files.pitch_file_path)
+        return self.intonation_analysis_service.slice_pitch_track(times, f0, time_range.start, time_range.end)
+
     def run(self, debug=True):
         self.app.run(host='0.0.0.0', port=5000, debug=debug)
 
@@ -0,0 +1,75 @@
+import os
+import time
+
+import librosa
+import numpy as np
+
+from data.model.input_models.transcription_data import Word
+from service.accent_analysis_service import AccentAnalysisService
+
+base_dir = os.path.dirname(__file__)
+accent_data_dir = os.path.join(base_dir, '..', 'test', 'accent_audio_test_data')
+
+
+def build_utterance(suffix):
+    signals = []
+    words = []
+    position = 0
+    sr = None
+    for i in range(2, 51):
+        path = os.path.join(accent_data_dir, f'test{i}{suffix}.wav')
+        if not os.path.exists(path):
+            continue
+        signal, sr = librosa.load(path, sr=None)
+        words.append(Word(f'word{i}', position / sr, (position + len(signal)) / sr, 1.0, f'word{i}', 0, 1.0))
+        signals.append(signal)
+        position += len(signal)
+    return np.concatenate(signals), sr, words
+
+
+def build_word_pairs(accent_service, lector_audio, lsr, lector_words, user_audio, usr, user_words):
+    lector_vowels = accent_service.vowels_service.find_vowels_for_spans(
+        lector_audio, lsr, [(word.start, word.end) for word in lector_words])
+    user_vowels = accent_service.vowels_service.find_vowels_for_spans(
+        user_audio, usr, [(word.start, word.end) for word in user_words])
+    return list(zip(lector_words, user_words, lector_vowels, user_vowels))
+
+
+def measure(accent_service, lector_audio, lsr, user_audio, usr, word_pairs, repeats=5):
+    if accent_service.execution_mode == AccentAnalysisService.PROCESS_MODE:
+        process = accent_service.process_word_pairs_in_processes
+    else:
+        process = accent_service.process_word_pairs_in_threads
+
+    process(lector_audio, lsr, user_audio, usr, word_pairs)
+
+    best_time = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        process(lector_audio, lsr, user_audio, usr, word_pairs)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+
+def main():
+    lector_audio, lsr, lector_words = build_utterance('a')
+    user_audio, usr, user_words = build_utterance('c')
+
+    pairs_service = AccentAnalysisService()
+    word_pairs = build_word_pairs(pairs_service, lector_audio, lsr, lector_words, user_audio, usr, user_words)
+    print(f"word pairs: {len(word_pairs)}")
+
+    thread_service = AccentAnalysisService(execution_mode=AccentAnalysisService.THREAD_MODE)
+    print(f"threads: {measure(thread_service, lector_audio, lsr, user_audio, usr, word_pairs):.3f} s")
+
+    for workers in (2, 4):
+        for chunk_size in (1, 8):
+            process_service = AccentAnalysisService(execution_mode=AccentAnalysisService.PROCESS_MODE,
+                                                    max_workers=workers, chunk_size=chunk_size)
+            elapsed = measure(process_service, lector_audio, lsr, user_audio, usr, word_pairs)
+            process_service.shutdown()
+            print(f"processes (workers={workers}, chunk_size={chunk_size}): {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
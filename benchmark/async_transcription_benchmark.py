@@ -0,0 +1,65 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmark.deepgram_stub_server import DeepgramStubServer
+from data.remote_data_source.async_transcription_remote_data_source import AsyncTranscriptService
+from data.remote_data_source.transcript_cache import TranscriptCache
+
+
+def create_audio_files(directory, count, size=256 * 1024):
+    filepaths = []
+    for i in range(count):
+        filepath = os.path.join(directory, f'audio{i}.wav')
+        with open(filepath, 'wb') as file:
+            file.write(os.urandom(size))
+        filepaths.append(filepath)
+    return filepaths
+
+
+async def transcribe(stub, filepaths, concurrent, max_connections):
+    with tempfile.TemporaryDirectory() as cache_directory:
+        async with AsyncTranscriptService('stub-key', stub.url, TranscriptCache(cache_directory),
+                                          max_connections, upload_format=None) as transcript_service:
+            latencies = []
+
+            async def transcribe_one(filepath):
+                start = time.perf_counter()
+                transcript = await transcript_service.get_transcript_data_from_deepgram(filepath)
+                latencies.append(time.perf_counter() - start)
+                return transcript
+
+            start = time.perf_counter()
+            if concurrent:
+                transcripts = await asyncio.gather(*(transcribe_one(filepath) for filepath in filepaths))
+            else:
+                transcripts = [await transcribe_one(filepath) for filepath in filepaths]
+            elapsed_time = time.perf_counter() - start
+
+    assert all(transcript is not None for transcript in transcripts)
+    return elapsed_time, latencies
+
+
+def measure(name, filepaths, delay, concurrent, max_connections):
+    with DeepgramStubServer(delay=delay) as stub:
+        elapsed_time, latencies = asyncio.run(transcribe(stub, filepaths, concurrent, max_connections))
+        print(f"{name}: {elapsed_time:.2f} s for {len(filepaths)} files "
+              f"({len(filepaths) / elapsed_time:.1f} files/s), "
+              f"mean latency {sum(latencies) / len(latencies) * 1000:.0f} ms, "
+              f"max latency {max(latencies) * 1000:.0f} ms, "
+              f"{stub.connections_count} connections for {stub.requests_count} requests")
+
+
+def main():
+    delay = 0.25
+    with tempfile.TemporaryDirectory() as directory:
+        filepaths = create_audio_files(directory, 16)
+
+        measure('sequential', filepaths, delay, concurrent=False, max_connections=1)
+        measure('concurrent, 4 pooled connections', filepaths, delay, concurrent=True, max_connections=4)
+        measure('concurrent, 16 pooled connections', filepaths, delay, concurrent=True, max_connections=16)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import time
+import tracemalloc
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from service.audio_service import AudioService
+
+
+def create_lesson_audio(filepath, duration, sr=44100, block_duration=60):
+    rng = np.random.default_rng(0)
+    with sf.SoundFile(filepath, 'w', sr, 2, 'PCM_16') as output:
+        for _ in range(0, duration, block_duration):
+            block = 0.1 * rng.standard_normal((block_duration * sr, 1))
+            output.write(np.repeat(block, 2, axis=1))
+    return filepath
+
+
+def load_full_and_slice(filepath, start, end, sample_rate):
+    audio, sr = librosa.load(filepath, sr=sample_rate)
+    return audio[int(start * sr):int(end * sr)], sr
+
+
+def measure(name, load, filepath, start, end, sample_rate=AudioService.ANALYSIS_SAMPLE_RATE):
+    tracemalloc.start()
+    begin = time.perf_counter()
+    segment, _ = load(filepath, start, end, sample_rate)
+    elapsed_time = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: {elapsed_time * 1000:.1f} ms, peak allocations {peak / 1e6:.1f} MB, "
+          f"{len(segment)} samples")
+    return segment
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for minutes in [5, 20, 60]:
+            filepath = create_lesson_audio(os.path.join(directory, f'lector_audio{minutes}.wav'), minutes * 60)
+            start = minutes * 60 / 2
+            print(f"{minutes} min 44.1 kHz stereo lesson ({os.path.getsize(filepath) / 1e6:.0f} MB), "
+                  f"3 s segment at {start:.0f} s")
+            full = measure('  full load + slice', load_full_and_slice, filepath, start, start + 3)
+            segment = measure('  seek + segment read', AudioService.load_audio_segment, filepath, start, start + 3)
+            print(f"  max difference {np.max(np.abs(full - segment)):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import time
+
+import numpy as np
+
+from benchmark.vowels_engine_benchmark import load_vowels_test_signals
+from service.autocorrelation_engine import AutocorrelationEngine
+from service.frame_features import FrameFeatures
+
+
+def correlate_each_frame(signal, frame_length, hop_length):
+    autocorrelation = []
+    for i in range(0, len(signal) - frame_length, hop_length):
+        frame = signal[i:i + frame_length]
+        correlation = np.correlate(frame, frame, mode='full')
+        autocorrelation.append(correlation[len(correlation) // 2])
+    return np.array(autocorrelation)
+
+
+def measure(function, signals):
+    start = time.perf_counter()
+    for signal, sr in signals:
+        function(signal, sr)
+    return time.perf_counter() - start
+
+
+def main():
+    signals = load_vowels_test_signals()
+
+    def per_frame(signal, sr):
+        frame_length = int(0.01 * sr)
+        return correlate_each_frame(signal, frame_length, frame_length)
+
+    def batched_energy(signal, sr):
+        frame_length = int(0.01 * sr)
+        frames = FrameFeatures.frame_signal(signal, frame_length, frame_length)
+        return AutocorrelationEngine.zero_lag_energy(frames)
+
+    def batched_periodicity(signal, sr):
+        return FrameFeatures(signal, sr).periodicity
+
+    per_frame_time = measure(per_frame, signals)
+    energy_time = measure(batched_energy, signals)
+    periodicity_time = measure(batched_periodicity, signals)
+
+    print(f"per-frame np.correlate: {per_frame_time:.3f} s")
+    print(f"batched zero-lag energy: {energy_time:.3f} s ({per_frame_time / energy_time:.1f}x)")
+    print(f"batched FFT periodicity: {periodicity_time:.3f} s ({per_frame_time / periodicity_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import time
+
+from deepgram import DeepgramClient, DeepgramClientOptions
+
+from benchmark.deepgram_stub_server import DeepgramStubServer, create_tone_response, create_tone_speech
+from data.remote_data_source.transcript_cache import TranscriptCache
+from data.remote_data_source.transcription_remote_data_source import TranscriptService
+from service.chunked_transcription_service import ChunkedTranscriptionService
+from service.compute_executor import ComputeExecutor
+
+
+def measure(stub, executor, audio_filepath, audio, sr, chunk_duration):
+    with tempfile.TemporaryDirectory() as cache_directory:
+        transcript_service = TranscriptService(TranscriptCache(cache_directory), deepgram_client=DeepgramClient(
+            'stub-key', DeepgramClientOptions(url=stub.url)))
+        chunked_service = ChunkedTranscriptionService(transcript_service, executor, chunk_duration=chunk_duration)
+
+        start = time.perf_counter()
+        words = chunked_service.get_words(audio_filepath, audio, sr)
+        return time.perf_counter() - start, words
+
+
+def main():
+    sr = 16000
+    audio = create_tone_speech(1500, sr)
+    executor = ComputeExecutor(io_workers=16)
+
+    with tempfile.TemporaryDirectory() as directory:
+        audio_filepath = ChunkedTranscriptionService.write_chunk(os.path.join(directory, 'lector.wav'), audio, sr)
+        print(f"lector audio: {len(audio) / sr / 60:.1f} min, stub processing 0.2 s + 2% of audio duration")
+
+        with DeepgramStubServer(response_factory=create_tone_response, delay=0.2, realtime_factor=0.02) as stub:
+            _, reference_words = measure(stub, executor, audio_filepath, audio, sr, float('inf'))
+            for chunk_duration in [float('inf'), 300, 120, 60, 30]:
+                requests_count = stub.requests_count
+                elapsed_time, words = measure(stub, executor, audio_filepath, audio, sr, chunk_duration)
+                matching = [word.word for word in words] == [word.word for word in reference_words]
+                print(f"chunk duration {chunk_duration}: {elapsed_time:.2f} s, "
+                      f"{stub.requests_count - requests_count} requests, {len(words)} words, "
+                      f"matches single request: {matching}")
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
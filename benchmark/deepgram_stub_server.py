@@ -0,0 +1,215 @@
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import soundfile as sf
+
+
+def create_recorded_response(words=('hello', 'world'), word_duration=0.5):
+    return create_timed_response([(word, i * word_duration, (i + 1) * word_duration) for i, word in enumerate(words)])
+
+
+def create_timed_response(timed_words):
+    word_dicts = [{
+        'word': word,
+        'start': start,
+        'end': end,
+        'confidence': 0.99,
+        'punctuated_word': word.capitalize(),
+        'speaker': 0,
+        'speaker_confidence': 0.9,
+    } for word, start, end in timed_words]
+    transcript = ' '.join(word['punctuated_word'] for word in word_dicts)
+    duration = word_dicts[-1]['end'] if word_dicts else 0.0
+
+    return {
+        'metadata': {
+            'request_id': 'stub',
+            'sha256': '',
+            'created': '2024-01-01T00:00:00.000Z',
+            'duration': duration,
+            'channels': 1,
+            'models': ['stub-model'],
+            'model_info': {'stub-model': {'name': 'general-nova', 'version': 'stub', 'arch': 'nova'}},
+        },
+        'results': {
+            'channels': [{
+                'alternatives': [{
+                    'transcript': transcript,
+                    'confidence': 0.99,
+                    'words': word_dicts,
+                    'paragraphs': {
+                        'transcript': transcript,
+                        'paragraphs': [{
+                            'sentences': [{'text': transcript, 'start': 0.0, 'end': duration}],
+                            'start': 0.0,
+                            'end': duration,
+                            'num_words': len(word_dicts),
+                            'speaker': 0,
+                        }],
+                    },
+                }],
+                'detected_language': 'en',
+                'language_confidence': 0.99,
+            }],
+        },
+    }
+
+
+def create_tone_speech(words_count, sr=16000):
+    parts = []
+    for i in range(words_count):
+        t = np.arange(int(0.4 * sr)) / sr
+        parts.append(0.5 * np.sin(2 * np.pi * (300 + 100 * (i % 20)) * t))
+        parts.append(np.zeros(int((1.0 if i % 7 == 6 else 0.3) * sr)))
+    return np.concatenate(parts).astype(np.float32)
+
+
+def create_tone_response(audio_data, frame_duration=0.01, threshold_ratio=0.1):
+    audio, sr = sf.read(io.BytesIO(audio_data), always_2d=True)
+    audio = audio.mean(axis=1)
+    frame_length = int(frame_duration * sr)
+    frames_count = len(audio) // frame_length
+    rms = np.sqrt(np.mean(audio[:frames_count * frame_length].reshape(frames_count, frame_length) ** 2, axis=1))
+    voiced = np.concatenate([[False], rms > threshold_ratio * np.max(rms, initial=0.0), [False]])
+
+    edges = np.flatnonzero(np.diff(voiced.astype(np.int8)))
+    timed_words = []
+    for start_frame, end_frame in zip(edges[::2], edges[1::2]):
+        segment = audio[start_frame * frame_length:end_frame * frame_length]
+        frequency = np.argmax(np.abs(np.fft.rfft(segment))) * sr / len(segment)
+        timed_words.append((f'tone{int(round(frequency, -1))}', start_frame * frame_duration,
+                            end_frame * frame_duration))
+    return create_timed_response(timed_words)
+
+
+def get_audio_duration(audio_data):
+    try:
+        return sf.info(io.BytesIO(audio_data)).duration
+    except RuntimeError:
+        return 0.0
+
+
+class DeepgramStubServer:
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response=None, delay=0.0, host='127.0.0.1', port=0, upload_bandwidth=None,
+                 response_factory=None, realtime_factor=0.0, error_rate=0.0):
+        self.response_data = json.dumps(response or create_recorded_response()).encode('utf-8')
+        self.response_factory = response_factory
+        self.delay = delay
+        self.realtime_factor = realtime_factor
+        self.error_rate = error_rate
+        self.errors_count = 0
+        self.upload_bandwidth = upload_bandwidth
+        self.requests_count = 0
+        self.received_bytes = 0
+        self.connections_count = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self.create_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @classmethod
+    def from_file(cls, response_path, delay=0.0, host='127.0.0.1', port=0, upload_bandwidth=None):
+        with open(response_path, 'r') as file:
+            return cls(json.load(file), delay, host, port, upload_bandwidth)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections_count += 1
+
+            def handle(self):
+                try:
+                    super().handle()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def do_POST(self):
+                remaining_bytes = int(self.headers.get('Content-Length', 0))
+                chunks = []
+                while remaining_bytes > 0:
+                    chunk = self.rfile.read(min(stub.READ_CHUNK_SIZE, remaining_bytes))
+                    remaining_bytes -= len(chunk)
+                    chunks.append(chunk)
+                    if stub.upload_bandwidth:
+                        time.sleep(len(chunk) / stub.upload_bandwidth)
+                    with stub.lock:
+                        stub.received_bytes += len(chunk)
+                audio_data = b''.join(chunks)
+
+                with stub.lock:
+                    stub.requests_count += 1
+                delay = stub.delay() if callable(stub.delay) else stub.delay
+                if stub.realtime_factor:
+                    delay += stub.realtime_factor * get_audio_duration(audio_data)
+                time.sleep(delay)
+
+                if stub.error_rate and random.random() < stub.error_rate:
+                    with stub.lock:
+                        stub.errors_count += 1
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                response_data = stub.response_data
+                if stub.response_factory:
+                    response_data = json.dumps(stub.response_factory(audio_data)).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response_data)))
+                self.end_headers()
+                self.wfile.write(response_data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    with DeepgramStubServer(delay=0.5, port=8765) as stub:
+        print(f"Deepgram stub listening on {stub.url}/v1/listen, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"served {stub.requests_count} requests over {stub.connections_count} connections")
+
+
+if __name__ == "__main__":
+    main()
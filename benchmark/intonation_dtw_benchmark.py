@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+from fastdtw import fastdtw
+
+from benchmark.pitch_backend_benchmark import count_correct_verdicts, load_intonation_test_pairs
+from service.audio_service import AudioService
+from service.dtw_aligner import DtwAligner
+from service.intonation_analysis_service import IntonationAnalysisService
+
+
+def load_pitch_pairs():
+    intonation_service = IntonationAnalysisService()
+    pitch_pairs = []
+    for lector_signal, lector_sr, user_signal, user_sr in load_intonation_test_pairs(AudioService.ANALYSIS_SAMPLE_RATE):
+        pitch_pairs.append((intonation_service.get_pitch_array(lector_signal, lector_sr),
+                            intonation_service.get_pitch_array(user_signal, user_sr)))
+    return pitch_pairs
+
+
+def measure_comparison(intonation_service, pitch_pairs, repeats=20):
+    best_time = float('inf')
+    similarities = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        similarities = [intonation_service.compare_pitch_contours(pitch1, pitch2)[2] for pitch1, pitch2 in pitch_pairs]
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time, similarities
+
+
+def measure_alignment_scaling(lengths, band_ratio=DtwAligner.BAND_RATIO):
+    rng = np.random.default_rng(0)
+    for length in lengths:
+        contour1 = np.cumsum(rng.standard_normal(length))
+        contour2 = np.cumsum(rng.standard_normal(int(length * 1.2)))
+
+        start = time.perf_counter()
+        DtwAligner.align(contour1, contour2, band_ratio)
+        banded_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fastdtw(contour1, contour2)
+        fastdtw_time = time.perf_counter() - start
+
+        print(f"length {length}: banded DTW {banded_time * 1000:.1f} ms, "
+              f"fastdtw (radius 1) {fastdtw_time * 1000:.1f} ms")
+
+
+def main():
+    pitch_pairs = load_pitch_pairs()
+    print(f"contour lengths: {[(len(pitch1), len(pitch2)) for pitch1, pitch2 in pitch_pairs]}")
+
+    services = {
+        'interpolation': IntonationAnalysisService(),
+        'banded DTW': IntonationAnalysisService(comparison_mode=IntonationAnalysisService.DTW_MODE),
+        'full DTW': IntonationAnalysisService(comparison_mode=IntonationAnalysisService.DTW_MODE, dtw_band_ratio=1.0),
+    }
+    for name, intonation_service in services.items():
+        elapsed_time, similarities = measure_comparison(intonation_service, pitch_pairs)
+        print(f"{name}: {elapsed_time * 1000:.2f} ms for {len(pitch_pairs)} pairs, "
+              f"similarities: {[round(float(similarity), 3) for similarity in similarities]}, "
+              f"correct verdicts: {count_correct_verdicts(similarities)}/{len(similarities)}")
+
+    measure_alignment_scaling([250, 1000, 4000])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+import time
+
+import librosa
+
+from service.audio_service import AudioService
+from service.intonation_analysis_service import IntonationAnalysisService
+from service.pitch_backends import PyinPitchBackend
+
+base_dir = os.path.dirname(__file__)
+intonation_data_dir = os.path.join(base_dir, '..', 'test', 'intonation_audio_test_data')
+expected_high_similarity = [False, True, False, True, True]
+similarity_threshold = 0.7
+legacy_sample_rate = 22050
+
+
+def load_intonation_test_pairs(sample_rate=None):
+    pairs = []
+    for i in range(1, 6):
+        lector_signal, lector_sr = librosa.load(os.path.join(intonation_data_dir, f'test{i}a.wav'), sr=sample_rate)
+        user_signal, user_sr = librosa.load(os.path.join(intonation_data_dir, f'test{i}b.wav'), sr=sample_rate)
+        pairs.append((lector_signal, lector_sr, user_signal, user_sr))
+    return pairs
+
+
+def create_legacy_service():
+    intonation_service = IntonationAnalysisService()
+    intonation_service.pitch_backend = PyinPitchBackend(fmin=librosa.note_to_hz('C2'),
+                                                        fmax=librosa.note_to_hz('C7'),
+                                                        hop_duration=512 / legacy_sample_rate,
+                                                        frame_duration=2048 / legacy_sample_rate)
+    return intonation_service
+
+
+def measure_service(intonation_service, pairs, pass_sample_rate=True):
+    start = time.perf_counter()
+    similarities = []
+    for lector_signal, lector_sr, user_signal, user_sr in pairs:
+        if not pass_sample_rate:
+            lector_sr = user_sr = legacy_sample_rate
+        _, _, similarity = intonation_service.get_intonation_success_rate(lector_signal, lector_sr, user_signal,
+                                                                          user_sr)
+        similarities.append(similarity)
+    return time.perf_counter() - start, similarities
+
+
+def count_correct_verdicts(similarities):
+    return sum((similarity > similarity_threshold) == expected
+               for similarity, expected in zip(similarities, expected_high_similarity))
+
+
+def print_result(name, elapsed_time, similarities, reference_similarities):
+    max_difference = max(abs(a - b) for a, b in zip(similarities, reference_similarities))
+    print(f"{name}: {elapsed_time:.2f} s, "
+          f"similarities: {[round(float(similarity), 3) for similarity in similarities]}, "
+          f"max difference to pyin: {max_difference:.3f}, "
+          f"correct verdicts: {count_correct_verdicts(similarities)}/{len(similarities)}")
+
+
+def main():
+    pairs = load_intonation_test_pairs()
+    analysis_pairs = load_intonation_test_pairs(AudioService.ANALYSIS_SAMPLE_RATE)
+
+    results = {}
+    for backend in IntonationAnalysisService.PITCH_BACKENDS:
+        results[backend] = measure_service(IntonationAnalysisService(pitch_backend=backend), pairs)
+        results[f'{backend} @ {AudioService.ANALYSIS_SAMPLE_RATE} Hz'] = measure_service(
+            IntonationAnalysisService(pitch_backend=backend), analysis_pairs)
+    results['pyin C2-C7 (legacy)'] = measure_service(create_legacy_service(), pairs, pass_sample_rate=False)
+
+    _, reference_similarities = results[IntonationAnalysisService.PYIN_BACKEND]
+    for name, (elapsed_time, similarities) in results.items():
+        print_result(name, elapsed_time, similarities, reference_similarities)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import time
+import tracemalloc
+
+from benchmark.deepgram_stub_server import create_recorded_response
+from data.model.input_models.transcription_data import JSONResponse
+
+
+def create_long_response(words_count=10000, words_per_sentence=12, sentences_per_paragraph=5):
+    response = create_recorded_response([f'word{i % 500}' for i in range(words_count)], word_duration=0.36)
+    alternative = response['results']['channels'][0]['alternatives'][0]
+    words = alternative['words']
+
+    sentences = []
+    for start in range(0, words_count, words_per_sentence):
+        sentence_words = words[start:start + words_per_sentence]
+        sentences.append({'text': ' '.join(word['punctuated_word'] for word in sentence_words) + '.',
+                          'start': sentence_words[0]['start'], 'end': sentence_words[-1]['end']})
+
+    paragraphs = []
+    for start in range(0, len(sentences), sentences_per_paragraph):
+        paragraph_sentences = sentences[start:start + sentences_per_paragraph]
+        paragraphs.append({'sentences': paragraph_sentences, 'start': paragraph_sentences[0]['start'],
+                           'end': paragraph_sentences[-1]['end'],
+                           'num_words': len(paragraph_sentences) * words_per_sentence, 'speaker': 0})
+    alternative['paragraphs']['paragraphs'] = paragraphs
+    return response
+
+
+def parse_words(response_dict):
+    transcript = JSONResponse(**response_dict)
+    return transcript, transcript.results.channels[0].alternatives[0].words
+
+
+def measure_time(response_dict, repeats=10):
+    best_time = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parse_words(response_dict)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+
+def measure_memory(response_dict):
+    tracemalloc.start()
+    parsed = parse_words(response_dict)
+    current_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return current_memory
+
+
+def main():
+    for words_count in [1000, 10000, 40000]:
+        response_dict = create_long_response(words_count)
+        print(f"{words_count} words: parse + words access {measure_time(response_dict) * 1000:.1f} ms, "
+              f"retained {measure_memory(response_dict) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+from deepgram import DeepgramClient, DeepgramClientOptions
+
+from benchmark.deepgram_stub_server import DeepgramStubServer
+from data.remote_data_source.request_runner import RequestRunner
+from data.remote_data_source.transcript_cache import TranscriptCache
+from data.remote_data_source.transcription_remote_data_source import TranscriptService
+
+
+def sample_delay():
+    return 3.0 if random.random() < 0.05 else random.uniform(0.15, 0.25)
+
+
+def create_user_recordings(directory, count, sr=16000):
+    rng = np.random.default_rng(0)
+    filepaths = []
+    for i in range(count):
+        filepath = os.path.join(directory, f'user_audio{i}.wav')
+        sf.write(filepath, 0.1 * rng.standard_normal(sr // 2), sr)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def measure(name, stub, filepaths, request_runner):
+    with tempfile.TemporaryDirectory() as cache_directory:
+        transcript_service = TranscriptService(
+            TranscriptCache(cache_directory), deepgram_client=DeepgramClient(
+                'stub-key', DeepgramClientOptions(url=stub.url)), request_runner=request_runner)
+
+        latencies = []
+        failures = 0
+        for filepath in filepaths:
+            start = time.perf_counter()
+            try:
+                transcript_service.get_transcript_data_from_deepgram(filepath)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - start)
+
+    stats = request_runner.get_stats()
+    request_runner.shutdown()
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{name}: p50 {p50 * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms, p99 {p99 * 1000:.0f} ms, "
+          f"max {max(latencies) * 1000:.0f} ms, failed {failures}/{len(filepaths)}, "
+          f"retries {stats['retries']}, attempt timeouts {stats['attempt_timeouts']}, "
+          f"hedges {stats['hedges']} (won {stats['hedge_wins']}), "
+          f"deadline exceeded {stats['deadline_exceeded']}")
+
+
+def main():
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        filepaths = create_user_recordings(directory, 200)
+        print("stub: 95% of requests take 150-250 ms, 5% take 3 s, 2% answer 503")
+
+        runners = {
+            'single attempt, no deadline': RequestRunner(deadline=300, max_retries=0),
+            'deadline 3 s, 1 s attempts, 2 retries': RequestRunner(deadline=3, attempt_timeout=1, max_retries=2,
+                                                                    backoff_base=0.1),
+            'deadline + retries + hedge at p90': RequestRunner(deadline=3, attempt_timeout=1, max_retries=2,
+                                                               backoff_base=0.1, hedge_percentile=90),
+        }
+        for name, request_runner in runners.items():
+            with DeepgramStubServer(delay=sample_delay, error_rate=0.02) as stub:
+                measure(name, stub, filepaths, request_runner)
+
+
+if __name__ == "__main__":
+    main()
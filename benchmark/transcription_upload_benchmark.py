@@ -0,0 +1,73 @@
+import asyncio
+import os
+import tempfile
+import time
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from benchmark.deepgram_stub_server import DeepgramStubServer
+from data.remote_data_source.async_transcription_remote_data_source import AsyncTranscriptService
+from data.remote_data_source.transcript_cache import TranscriptCache
+from service.audio_service import AudioService
+
+base_dir = os.path.dirname(__file__)
+intonation_data_dir = os.path.join(base_dir, '..', 'test', 'intonation_audio_test_data')
+
+
+def create_user_recording(filepath, duration=60, sr=44100):
+    signals = []
+    for file_name in sorted(os.listdir(intonation_data_dir)):
+        if file_name.endswith('.wav'):
+            signal, _ = librosa.load(os.path.join(intonation_data_dir, file_name), sr=sr)
+            signals.append(signal)
+
+    mono = np.resize(np.concatenate(signals), duration * sr)
+    sf.write(filepath, np.column_stack([mono, mono]), sr, subtype='PCM_16')
+    return filepath
+
+
+async def upload(stub, filepath, upload_format):
+    with tempfile.TemporaryDirectory() as cache_directory:
+        async with AsyncTranscriptService('stub-key', stub.url, TranscriptCache(cache_directory),
+                                          upload_format=upload_format) as transcript_service:
+            start = time.perf_counter()
+            transcript = await transcript_service.get_transcript_data_from_deepgram(filepath)
+            elapsed_time = time.perf_counter() - start
+
+    assert transcript is not None
+    return elapsed_time, transcript_service.upload.get_stats()
+
+
+def measure_encoding(filepath, upload_format):
+    with tempfile.TemporaryDirectory() as directory:
+        extension = AudioService.TRANSCRIPTION_FORMATS[upload_format][2]
+        start = time.perf_counter()
+        AudioService.encode_for_transcription(filepath, os.path.join(directory, 'upload' + extension), upload_format)
+        return time.perf_counter() - start
+
+
+def main():
+    upload_bandwidth = 1024 * 1024
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = create_user_recording(os.path.join(directory, 'user_audio.wav'))
+        print(f"user recording: 60 s, 44.1 kHz stereo, {os.path.getsize(filepath) / 1e6:.2f} MB, "
+              f"upload bandwidth {upload_bandwidth / 1e6:.2f} MB/s")
+
+        raw_time = None
+        for upload_format in [None, AudioService.FLAC_FORMAT, AudioService.OPUS_FORMAT]:
+            with DeepgramStubServer(upload_bandwidth=upload_bandwidth) as stub:
+                elapsed_time, stats = asyncio.run(upload(stub, filepath, upload_format))
+
+            raw_time = raw_time or elapsed_time
+            encoding_time = measure_encoding(filepath, upload_format) if upload_format else 0.0
+            print(f"{upload_format or 'raw wav'}: uploaded {stats['uploaded_bytes'] / 1e6:.2f} MB, "
+                  f"saved {stats['bytes_saved'] / 1e6:.2f} MB "
+                  f"({stats['bytes_saved'] / stats['original_bytes'] * 100:.0f}%), "
+                  f"encoding {encoding_time:.2f} s, request {elapsed_time:.2f} s, "
+                  f"upload time reduction {(1 - elapsed_time / raw_time) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import time
+
+import librosa
+
+from service.vowels_detection_service import VowelsDetectionService
+
+base_dir = os.path.dirname(__file__)
+vowels_data_dir = os.path.join(base_dir, '..', 'test', 'vowels_audio_test_data')
+
+
+def load_vowels_test_signals():
+    signals = []
+    for i in range(1, 51):
+        path = os.path.join(vowels_data_dir, f'test{i}.wav')
+        signals.append(librosa.load(path, sr=None))
+    return signals
+
+
+def measure_engine(engine, signals, repeats=3):
+    vowels_service = VowelsDetectionService(engine=engine)
+
+    best_time = float('inf')
+    segments = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        segments = [vowels_service.find_vowels(signal, sr) for signal, sr in signals]
+        best_time = min(best_time, time.perf_counter() - start)
+
+    return best_time, segments
+
+
+def main():
+    signals = load_vowels_test_signals()
+
+    loop_time, loop_segments = measure_engine(VowelsDetectionService.LOOP_ENGINE, signals, repeats=1)
+    mask_time, mask_segments = measure_engine(VowelsDetectionService.MASK_ENGINE, signals)
+
+    same_counts = sum(len(a) == len(b) for a, b in zip(loop_segments, mask_segments))
+
+    print(f"loop engine: {loop_time:.3f} s")
+    print(f"mask engine: {mask_time:.3f} s")
+    print(f"speedup: {loop_time / mask_time:.1f}x")
+    print(f"matching segment counts: {same_counts}/{len(signals)}")
+
+
+if __name__ == "__main__":
+    main()
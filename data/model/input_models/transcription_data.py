@@ -1,4 +1,6 @@
 class Word:
+    __slots__ = ('word', 'start', 'end', 'confidence', 'punctuated_word', 'speaker', 'speaker_confidence')
+
     def __init__(self, word, start, end, confidence, punctuated_word, speaker, speaker_confidence):
         self.word = word
         self.start = start
@@ -21,6 +23,8 @@ class Word:
 
 
 class Sentence:
+    __slots__ = ('text', 'start', 'end')
+
     def __init__(self, text, start, end):
         self.text = text
         self.start = start
@@ -28,18 +32,38 @@ class Sentence:
 
 
 class ParagraphText:
+    __slots__ = ('start', 'end', 'num_words', 'speaker', '_sentence_dicts', '_sentences')
+
     def __init__(self, sentences, start, end, num_words, speaker):
-        self.sentences = [Sentence(**sentence) for sentence in sentences]
+        self._sentence_dicts = sentences
+        self._sentences = None
         self.start = start
         self.end = end
         self.num_words = num_words
         self.speaker = speaker
 
+    @property
+    def sentences(self):
+        if self._sentences is None:
+            self._sentences = [Sentence(**sentence) for sentence in self._sentence_dicts]
+            self._sentence_dicts = None
+        return self._sentences
+
 
 class Paragraphs:
+    __slots__ = ('transcript', '_paragraph_dicts', '_paragraphs')
+
     def __init__(self, transcript, paragraphs):
         self.transcript = transcript
-        self.paragraphs = [self.create_paragraph(paragraph) for paragraph in paragraphs]
+        self._paragraph_dicts = paragraphs
+        self._paragraphs = None
+
+    @property
+    def paragraphs(self):
+        if self._paragraphs is None:
+            self._paragraphs = [self.create_paragraph(paragraph) for paragraph in self._paragraph_dicts]
+            self._paragraph_dicts = None
+        return self._paragraphs
 
     @staticmethod
     def create_paragraph(paragraph):
@@ -49,43 +73,92 @@ class Paragraphs:
 
 
 class Alternative:
+    __slots__ = ('transcript', 'confidence', 'entities', 'translations', 'topics', 'summaries',
+                 '_word_dicts', '_words', '_paragraphs_dict', '_paragraphs')
+
     def __init__(self, transcript, confidence, words, paragraphs, entities=None, translations=None, topics=None, summaries=None):
         self.transcript = transcript
         self.confidence = confidence
-        self.words = [Word(**word) for word in words]
-        self.paragraphs = Paragraphs(**paragraphs)
+        self._word_dicts = words
+        self._words = None
+        self._paragraphs_dict = paragraphs
+        self._paragraphs = None
         self.entities = entities
         self.translations = translations
         self.topics = topics
         self.summaries = summaries
 
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = [Word(**word) for word in self._word_dicts]
+            self._word_dicts = None
+        return self._words
+
+    @property
+    def paragraphs(self):
+        if self._paragraphs is None:
+            self._paragraphs = Paragraphs(**self._paragraphs_dict)
+            self._paragraphs_dict = None
+        return self._paragraphs
+
 
 class Channel:
+    __slots__ = ('search', 'detected_language', 'language_confidence', '_alternative_dicts', '_alternatives')
+
     def __init__(self, alternatives, detected_language, language_confidence, search=None):
         self.search = search
-        self.alternatives = [Alternative(**alternative) for alternative in alternatives]
+        self._alternative_dicts = alternatives
+        self._alternatives = None
         self.detected_language = detected_language
         self.language_confidence = language_confidence
 
+    @property
+    def alternatives(self):
+        if self._alternatives is None:
+            self._alternatives = [Alternative(**alternative) for alternative in self._alternative_dicts]
+            self._alternative_dicts = None
+        return self._alternatives
+
 
 class Utterance:
+    __slots__ = ('start', 'end', 'confidence', 'channel', 'transcript', 'speaker', 'id', '_word_dicts', '_words')
+
     def __init__(self, start, end, confidence, channel, transcript, words, speaker, id):
         self.start = start
         self.end = end
         self.confidence = confidence
         self.channel = channel
         self.transcript = transcript
-        self.words = [Word(**word) for word in words]
+        self._word_dicts = words
+        self._words = None
         self.speaker = speaker
         self.id = id
 
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = [Word(**word) for word in self._word_dicts]
+            self._word_dicts = None
+        return self._words
+
 
 class Results:
+    __slots__ = ('_channel_dicts', '_channels')
+
     def __init__(self, channels, utterances=None, summary=None):
-        self.channels = [Channel(**channel) for channel in channels]
+        self._channel_dicts = channels
+        self._channels = None
         # self.utterances = [Utterance(**utterance) for utterance in utterances]
         # self.summary = summary
 
+    @property
+    def channels(self):
+        if self._channels is None:
+            self._channels = [Channel(**channel) for channel in self._channel_dicts]
+            self._channel_dicts = None
+        return self._channels
+
 
 class ModelInfo:
     def __init__(self, name, version, arch):
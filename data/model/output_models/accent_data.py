@@ -1,8 +1,16 @@
 class AccentData:
-    def __init__(self, word, sampled_audio_lector, sampled_audio_user):
+    def __init__(self, word, sampled_audio_lector, sampled_audio_user, encoding=None):
         self.word = word
         self.sampled_audio_lector = sampled_audio_lector
         self.sampled_audio_user = sampled_audio_user
+        self.encoding = encoding
 
     def to_dict(self):
-        return self.__dict__
+        accent_dict = {
+            'word': self.word,
+            'sampled_audio_lector': self.sampled_audio_lector,
+            'sampled_audio_user': self.sampled_audio_user
+        }
+        if self.encoding is not None:
+            accent_dict['encoding'] = self.encoding
+        return accent_dict
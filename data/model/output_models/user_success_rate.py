@@ -3,7 +3,7 @@ import json
 
 class UserSuccessRate:
     def __init__(self, words_accuracy, transcription, accent_accuracy, accent, intonation_accuracy, intonation,
-                 pronunciation_accuracy):
+                 pronunciation_accuracy, pronunciation_job_id=None):
         self.words_accuracy = words_accuracy
         self.transcription = transcription
         self.accent_accuracy = accent_accuracy
@@ -11,6 +11,7 @@ class UserSuccessRate:
         self.intonation_accuracy = intonation_accuracy
         self.intonation = intonation
         self.pronunciation_accuracy = pronunciation_accuracy
+        self.pronunciation_job_id = pronunciation_job_id
 
     def to_json(self):
         return json.dumps({
@@ -20,5 +21,6 @@ class UserSuccessRate:
             'accent': [accent_data.to_dict() for accent_data in self.accent],
             'intonationAccuracy': self.intonation_accuracy,
             'intonation': self.intonation.to_json(),
-            'pronunciationAccuracy': self.pronunciation_accuracy
+            'pronunciationAccuracy': self.pronunciation_accuracy,
+            'pronunciationJobId': self.pronunciation_job_id
         })
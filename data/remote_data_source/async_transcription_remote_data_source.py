@@ -0,0 +1,87 @@
+import asyncio
+import os
+import tempfile
+
+import httpx
+from deepgram import PrerecordedOptions
+
+from data.model.input_models.transcription_data import JSONResponse
+from data.remote_data_source.transcript_cache import TranscriptCache
+from data.remote_data_source.transcription_upload import TranscriptionUpload
+from service.audio_service import AudioService
+
+
+class AsyncTranscriptService:
+    DEEPGRAM_URL = 'https://api.deepgram.com'
+    LISTEN_PATH = '/v1/listen'
+    MAX_CONNECTIONS = 10
+    TIMEOUT = 300.0
+    UPLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, api_key=None, base_url=DEEPGRAM_URL, cache=None, max_connections=MAX_CONNECTIONS,
+                 timeout=TIMEOUT, upload_format=AudioService.FLAC_FORMAT):
+        if api_key is None:
+            from utils import keys
+            api_key = keys.DEEPGRAM_API_KEY
+
+        self.cache = cache or TranscriptCache()
+        self.upload = TranscriptionUpload(upload_format)
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={'Authorization': f'Token {api_key}'},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def get_transcript_data_from_deepgram(self, audio_filepath):
+        options = self._get_default_options()
+
+        cache_key = await asyncio.to_thread(self.cache.create_file_key, audio_filepath, options)
+        response_dict = await asyncio.to_thread(self.cache.get, cache_key)
+        if response_dict is None:
+            response_dict = await self.post_audio(audio_filepath, options)
+            await asyncio.to_thread(self.cache.put, cache_key, response_dict)
+
+        return JSONResponse(**response_dict)
+
+    async def get_transcripts_data_from_deepgram(self, audio_filepaths):
+        return await asyncio.gather(*(self.get_transcript_data_from_deepgram(audio_filepath)
+                                      for audio_filepath in audio_filepaths))
+
+    async def post_audio(self, audio_filepath, options):
+        with tempfile.TemporaryDirectory() as directory:
+            upload_filepath = await asyncio.to_thread(self.upload.prepare, audio_filepath, directory)
+            with open(upload_filepath, "rb") as file:
+                response = await self.client.post(
+                    self.LISTEN_PATH,
+                    params=options.to_dict(),
+                    content=self.read_chunks(file),
+                    headers={'Content-Type': self.upload.content_type(audio_filepath),
+                             'Content-Length': str(os.path.getsize(upload_filepath))},
+                )
+
+        response.raise_for_status()
+        return response.json()
+
+    async def read_chunks(self, file):
+        while chunk := await asyncio.to_thread(file.read, self.UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    @staticmethod
+    def _get_default_options():
+        return PrerecordedOptions(
+            model="nova",
+            smart_format=True,
+            punctuate=True,
+            diarize=True,
+            detect_language=True,
+        )
@@ -0,0 +1,164 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import httpx
+import numpy as np
+from deepgram import DeepgramApiError
+
+
+class RequestRunner:
+    DEADLINE = 60.0
+    ATTEMPT_TIMEOUT = 20.0
+    MAX_RETRIES = 2
+    BACKOFF_BASE = 0.5
+    HEDGE_MIN_SAMPLES = 20
+    LATENCY_WINDOW = 500
+    MAX_WORKERS = 16
+    RETRYABLE_STATUS_CODES = (408, 429)
+
+    def __init__(self, deadline=DEADLINE, attempt_timeout=ATTEMPT_TIMEOUT, max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE,
+                 hedge_percentile=None, hedge_min_samples=HEDGE_MIN_SAMPLES, latency_window=LATENCY_WINDOW,
+                 max_workers=MAX_WORKERS):
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.attempt_latencies = deque(maxlen=latency_window)
+        self.call_latencies = deque(maxlen=latency_window)
+        self.counters = {'calls': 0, 'successes': 0, 'failures': 0, 'deadline_exceeded': 0, 'attempt_errors': 0,
+                         'attempt_timeouts': 0, 'retries': 0, 'hedges': 0, 'hedge_wins': 0}
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='request')
+
+    def run(self, request, deadline=None, attempt_timeout=None):
+        deadline = self.deadline if deadline is None else deadline
+        attempt_timeout = self.attempt_timeout if attempt_timeout is None else attempt_timeout
+        start = time.monotonic()
+        deadline_time = start + deadline
+        self.increment('calls')
+
+        last_exception = None
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.increment('retries')
+                backoff = random.uniform(0, self.backoff_base * 2 ** (attempt - 1))
+                time.sleep(min(backoff, max(deadline_time - time.monotonic(), 0)))
+
+            attempt_start = time.monotonic()
+            if attempt_start >= deadline_time:
+                break
+
+            attempt_deadline_time = deadline_time
+            if attempt_timeout is not None:
+                attempt_deadline_time = min(attempt_start + attempt_timeout, deadline_time)
+
+            try:
+                result = self.run_hedged(request, attempt_deadline_time)
+            except TimeoutError as e:
+                last_exception = e
+                if attempt_deadline_time >= deadline_time:
+                    break
+                self.increment('attempt_timeouts')
+                continue
+            except Exception as e:
+                self.increment('attempt_errors')
+                if not self.is_retryable(e):
+                    self.increment('failures')
+                    raise
+                last_exception = e
+                continue
+
+            self.record_latency(self.call_latencies, time.monotonic() - start)
+            self.increment('successes')
+            return result
+
+        if isinstance(last_exception, TimeoutError) or last_exception is None:
+            self.increment('deadline_exceeded')
+            raise TimeoutError(f"Request did not finish within {deadline} s")
+        self.increment('failures')
+        raise last_exception
+
+    def run_hedged(self, request, deadline_time):
+        futures = {self.submit_attempt(request, deadline_time): False}
+
+        hedge_delay = self.get_hedge_delay()
+        if hedge_delay is not None:
+            done, _ = wait(futures, timeout=min(hedge_delay, max(deadline_time - time.monotonic(), 0)))
+            if not done and time.monotonic() < deadline_time:
+                futures[self.submit_attempt(request, deadline_time)] = True
+                self.increment('hedges')
+
+        pending = set(futures)
+        last_exception = None
+        while pending:
+            done, pending = wait(pending, timeout=max(deadline_time - time.monotonic(), 0),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError("Request deadline exceeded")
+
+            for future in done:
+                if future.exception() is not None:
+                    last_exception = future.exception()
+                    continue
+                if futures[future]:
+                    self.increment('hedge_wins')
+                return future.result()
+
+        raise last_exception
+
+    @classmethod
+    def is_retryable(cls, exception):
+        if isinstance(exception, (TimeoutError, ConnectionError, httpx.TransportError)):
+            return True
+        status_code = cls.get_status_code(exception)
+        return status_code is not None and (status_code in cls.RETRYABLE_STATUS_CODES or status_code >= 500)
+
+    @staticmethod
+    def get_status_code(exception):
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code
+        if isinstance(exception, DeepgramApiError) and str(exception.status).isdigit():
+            return int(exception.status)
+        return None
+
+    def submit_attempt(self, request, deadline_time):
+        def attempt():
+            attempt_start = time.monotonic()
+            result = request(max(deadline_time - attempt_start, 0.001))
+            self.record_latency(self.attempt_latencies, time.monotonic() - attempt_start)
+            return result
+
+        return self.pool.submit(attempt)
+
+    def get_hedge_delay(self):
+        if self.hedge_percentile is None:
+            return None
+        with self.lock:
+            if len(self.attempt_latencies) < self.hedge_min_samples:
+                return None
+            return float(np.percentile(self.attempt_latencies, self.hedge_percentile))
+
+    def record_latency(self, latencies, latency):
+        with self.lock:
+            latencies.append(latency)
+
+    def increment(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+            latencies = list(self.call_latencies)
+
+        for percentile in [50, 95, 99]:
+            stats[f'p{percentile}'] = float(np.percentile(latencies, percentile)) if latencies else None
+        return stats
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class TranscriptCache:
+    DEFAULT_DIRECTORY = './transcript_cache'
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+    ENTRY_EXTENSION = '.json'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.entries = self.load_index()
+        self.total_bytes = sum(self.entries.values())
+
+    @staticmethod
+    def create_key(buffer_data, options):
+        return TranscriptCache.finish_key(hashlib.sha256(buffer_data), options)
+
+    @staticmethod
+    def create_file_key(filepath, options, chunk_size=HASH_CHUNK_SIZE):
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+        return TranscriptCache.finish_key(digest, options)
+
+    @staticmethod
+    def finish_key(digest, options):
+        options_dict = options.to_dict() if hasattr(options, 'to_dict') else dict(options or {})
+        digest.update(json.dumps(options_dict, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key + self.ENTRY_EXTENSION)
+
+    def load_index(self):
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(self.ENTRY_EXTENSION):
+                continue
+            stat = os.stat(os.path.join(self.directory, file_name))
+            entries.append((stat.st_mtime, file_name[:-len(self.ENTRY_EXTENSION)], stat.st_size))
+
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+
+            try:
+                with open(self.entry_path(key), 'r') as file:
+                    response_dict = json.load(file)
+            except (OSError, ValueError) as e:
+                print(f"Error reading cached transcript: {e}")
+                self.total_bytes -= self.entries.pop(key)
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            os.utime(self.entry_path(key))
+            self.hits += 1
+            return response_dict
+
+    def put(self, key, response_dict):
+        data = json.dumps(response_dict).encode('utf-8')
+        path = self.entry_path(key)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with self.lock:
+            with open(temporary_path, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+
+            self.total_bytes -= self.entries.pop(key, 0)
+            self.entries[key] = len(data)
+            self.total_bytes += len(data)
+            self.evict()
+
+    def evict(self):
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            key, size = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(self.entry_path(key))
+            except OSError as e:
+                print(f"Error removing cached transcript: {e}")
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+            }
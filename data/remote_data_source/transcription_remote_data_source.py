@@ -1,41 +1,74 @@
+import tempfile
+
+import httpx
+import soundfile as sf
 from deepgram import DeepgramClient, PrerecordedOptions, FileSource
 
 from data.model.input_models.transcription_data import JSONResponse
-from utils import keys
+from data.remote_data_source.request_runner import RequestRunner
+from data.remote_data_source.transcript_cache import TranscriptCache
+from data.remote_data_source.transcription_upload import TranscriptionUpload
+from service.audio_service import AudioService
 
 
 class TranscriptService:
-    def __init__(self):
-        self.deepgram_client = DeepgramClient(keys.DEEPGRAM_API_KEY)
+    LECTOR_TIMEOUT_PER_AUDIO_SECOND = 0.25
+
+    def __init__(self, cache=None, upload_format=AudioService.FLAC_FORMAT, deepgram_client=None, request_runner=None,
+                 lector_request_runner=None):
+        if deepgram_client is None:
+            from utils import keys
+            deepgram_client = DeepgramClient(keys.DEEPGRAM_API_KEY)
+
+        self.deepgram_client = deepgram_client
+        self.cache = cache or TranscriptCache()
+        self.upload = TranscriptionUpload(upload_format)
+        self.request_runner = request_runner or RequestRunner()
+        self.lector_request_runner = lector_request_runner or RequestRunner()
 
     def get_transcript_data_from_deepgram(self, audio_filepath):
-        try:
-            with open(audio_filepath, "rb") as file:
-                buffer_data = file.read()
+        return self.get_transcript_data(audio_filepath, self.request_runner)
 
-            payload: FileSource = {"buffer": buffer_data}
-            options = self._get_default_options()
+    def get_lector_transcript_data_from_deepgram(self, audio_filepath):
+        request_runner = self.lector_request_runner
+        audio_time = sf.info(audio_filepath).duration * self.LECTOR_TIMEOUT_PER_AUDIO_SECOND
+        attempt_timeout = None
+        if request_runner.attempt_timeout is not None:
+            attempt_timeout = request_runner.attempt_timeout + audio_time
+        deadline = request_runner.deadline + (request_runner.max_retries + 1) * audio_time
+        return self.get_transcript_data(audio_filepath, request_runner, deadline, attempt_timeout)
 
-            response = self.deepgram_client.listen.prerecorded.v("1").transcribe_file(payload, options)
-            response_dict = response.to_dict()
+    def get_transcript_data(self, audio_filepath, request_runner, deadline=None, attempt_timeout=None):
+        options = self._get_default_options()
 
-            return JSONResponse(**response_dict)
+        cache_key = self.cache.create_file_key(audio_filepath, options)
+        response_dict = self.cache.get(cache_key)
+        if response_dict is None:
+            with tempfile.TemporaryDirectory() as directory:
+                upload_filepath = self.upload.prepare(audio_filepath, directory)
 
-        except Exception as e:
-            print(f"Exception: {e}")
+                def transcribe_file(timeout):
+                    with open(upload_filepath, "rb") as file:
+                        payload: FileSource = {"stream": file}
+                        return self.deepgram_client.listen.prerecorded.v("1").transcribe_file(
+                            payload, options, timeout=httpx.Timeout(timeout))
 
-    def get_transcript_data_from_deepgram_url(self, url):
-        try:
-            source = {'url': url}
-            options = self._get_default_options()
+                response = request_runner.run(transcribe_file, deadline, attempt_timeout)
+            response_dict = response.to_dict()
+            self.cache.put(cache_key, response_dict)
 
-            response = self.deepgram_client.listen.prerecorded.v("1").transcribe_url(source, options)
-            response_json = response.to_json(indent=4)
-            with open('audio_source_transcription_youtube.json', 'w') as file:
-                file.write(response_json)
+        return JSONResponse(**response_dict)
+
+    def get_transcript_data_from_deepgram_url(self, url):
+        source = {'url': url}
+        options = self._get_default_options()
 
-        except Exception as e:
-            print(f"Exception: {e}")
+        response = self.request_runner.run(
+            lambda timeout: self.deepgram_client.listen.prerecorded.v("1").transcribe_url(
+                source, options, timeout=httpx.Timeout(timeout)))
+        response_json = response.to_json(indent=4)
+        with open('audio_source_transcription_youtube.json', 'w') as file:
+            file.write(response_json)
 
     @staticmethod
     def _get_default_options():
@@ -0,0 +1,54 @@
+import mimetypes
+import os
+import threading
+
+from service.audio_service import AudioService
+
+
+class TranscriptionUpload:
+    CONTENT_TYPES = {
+        AudioService.FLAC_FORMAT: 'audio/flac',
+        AudioService.OPUS_FORMAT: 'audio/ogg',
+    }
+
+    def __init__(self, audio_format=AudioService.FLAC_FORMAT, sample_rate=AudioService.ANALYSIS_SAMPLE_RATE):
+        if audio_format is not None and audio_format not in AudioService.TRANSCRIPTION_FORMATS:
+            raise ValueError(f"Unknown transcription format: {audio_format}")
+
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.uploads_count = 0
+        self.original_bytes = 0
+        self.uploaded_bytes = 0
+        self.lock = threading.Lock()
+
+    def content_type(self, audio_filepath):
+        if self.audio_format is None:
+            return mimetypes.guess_type(audio_filepath)[0] or 'application/octet-stream'
+        return self.CONTENT_TYPES[self.audio_format]
+
+    def prepare(self, audio_filepath, directory):
+        if self.audio_format is None:
+            upload_filepath = audio_filepath
+        else:
+            extension = AudioService.TRANSCRIPTION_FORMATS[self.audio_format][2]
+            upload_filepath = AudioService.encode_for_transcription(
+                audio_filepath, os.path.join(directory, 'upload' + extension), self.audio_format, self.sample_rate)
+
+        self.record_upload(os.path.getsize(audio_filepath), os.path.getsize(upload_filepath))
+        return upload_filepath
+
+    def record_upload(self, original_bytes, uploaded_bytes):
+        with self.lock:
+            self.uploads_count += 1
+            self.original_bytes += original_bytes
+            self.uploaded_bytes += uploaded_bytes
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'uploads': self.uploads_count,
+                'original_bytes': self.original_bytes,
+                'uploaded_bytes': self.uploaded_bytes,
+                'bytes_saved': self.original_bytes - self.uploaded_bytes,
+            }
@@ -1,16 +1,33 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import numpy as np
 from scipy.stats import pearsonr
 
 from data.model.output_models.accent_data import AccentData
 from service.audio_service import AudioService
+from service.compute_executor import ComputeExecutor
+from service.shared_audio import SharedAudio
 from service.vowels_detection_service import VowelsDetectionService
 from utils.vowel_checker import VowelChecker
 
 
 class AccentAnalysisService:
-    def __init__(self):
+    THREAD_MODE = 'thread'
+    PROCESS_MODE = 'process'
+
+    def __init__(self, execution_mode=THREAD_MODE, max_workers=None, chunk_size=1, chart_encoding=None,
+                 executor=None):
+        if execution_mode not in (self.THREAD_MODE, self.PROCESS_MODE):
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.chart_encoding = chart_encoding
+        self.process_pool = None
+        self.executor = executor or ComputeExecutor.get_instance()
+
         self.vowels_service = VowelsDetectionService()
         self.audio_service = AudioService()
         self.vowel_checker = VowelChecker()
@@ -19,6 +36,7 @@ class AccentAnalysisService:
         if not words_user or not words_lector:
             return []
 
+        words_lector = [copy.copy(word) for word in words_lector]
         for word in words_lector:
             word.start -= time_range.start
             word.end -= time_range.start
@@ -28,41 +46,97 @@ class AccentAnalysisService:
         if len(long_words_lector) < 1 or len(long_words_user) < 1:
             return []
 
+        lector_vowels = self.vowels_service.find_vowels_for_spans(
+            lector_audio, lsr, [(word.start, word.end) for word in long_words_lector])
+        user_vowels = self.vowels_service.find_vowels_for_spans(
+            user_audio, usr, [(word.start, word.end) for word in long_words_user])
+
+        word_pairs = list(zip(long_words_lector, long_words_user, lector_vowels, user_vowels))
+
+        if self.execution_mode == self.PROCESS_MODE:
+            return self.process_word_pairs_in_processes(lector_audio, lsr, user_audio, usr, word_pairs)
+        return self.process_word_pairs_in_threads(lector_audio, lsr, user_audio, usr, word_pairs)
+
+    def process_word_pairs_in_threads(self, lector_audio, lsr, user_audio, usr, word_pairs):
+        difference = []
+        futures = [self.executor.submit_cpu(self.process_word_pair, lector_audio, lsr, user_audio, usr, *pair)
+                   for pair in word_pairs]
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+                if result is not None:
+                    difference.append(result)
+            except Exception as e:
+                print(f"Exception occurred: {e}")
+                break
+
+        for future in futures:
+            future.cancel()
+        return difference
+
+    def process_word_pairs_in_processes(self, lector_audio, lsr, user_audio, usr, word_pairs):
         difference = []
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(
-                lambda pair: self.process_word_pair(lector_audio, lsr, user_audio, usr, *pair),
-                pair) for pair in zip(long_words_lector, long_words_user)]
+        chunks = [word_pairs[i:i + self.chunk_size] for i in range(0, len(word_pairs), self.chunk_size)]
+
+        with SharedAudio(lector_audio) as shared_lector, SharedAudio(user_audio) as shared_user:
+            executor = self.get_process_pool()
+            futures = [executor.submit(process_word_pairs_chunk, shared_lector.descriptor, lsr,
+                                       shared_user.descriptor, usr, chunk, self.chart_encoding)
+                       for chunk in chunks]
 
             for future in as_completed(futures):
                 try:
-                    result = future.result()
-                    if result is not None:
-                        difference.append(result)
+                    difference.extend(result for result in future.result() if result is not None)
                 except Exception as e:
                     print(f"Exception occurred: {e}")
-                    return difference
+                    break
+
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                if not future.cancelled():
+                    future.exception()
 
-        executor.shutdown()
         return difference
 
-    def process_word_pair(self, lector_audio, lsr, user_audio, usr, word_lector, word_user):
+    def get_process_pool(self):
+        if self.process_pool is None:
+            SharedAudio.ensure_tracker_running()
+            self.process_pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+        return self.process_pool
+
+    def shutdown(self):
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
+
+    def process_word_pair(self, lector_audio, lsr, user_audio, usr, word_lector, word_user, lector_vowels,
+                          user_vowels):
 
         segment_lector = self.audio_service.extract_segment(lector_audio, word_lector.start, word_lector.end, lsr)
         segment_user = self.audio_service.extract_segment(user_audio, word_user.start, word_user.end, usr)
 
-        is_accent_the_same = self.compare_accents_in_given_word(segment_lector, lsr, segment_user, usr)
+        is_accent_the_same = self.compare_vowels_accents(segment_lector, lsr, lector_vowels, segment_user, usr,
+                                                         user_vowels)
 
         if not is_accent_the_same:
-            lector_signal_data_to_send = self.audio_service.sample_audio_segment_to_draw_chart(segment_lector)
-            user_signal_data_to_send = self.audio_service.sample_audio_segment_to_draw_chart(segment_user)
-            return AccentData(word_lector.word, lector_signal_data_to_send, user_signal_data_to_send)
+            lector_signal_data_to_send = self.audio_service.sample_audio_segment_to_draw_chart(
+                segment_lector, encoding=self.chart_encoding)
+            user_signal_data_to_send = self.audio_service.sample_audio_segment_to_draw_chart(
+                segment_user, encoding=self.chart_encoding)
+            return AccentData(word_lector.word, lector_signal_data_to_send, user_signal_data_to_send,
+                              self.chart_encoding)
         return None
 
     def compare_accents_in_given_word(self, lector_signal, lsr, user_signal, usr):
         lector_vowels = self.vowels_service.find_vowels(lector_signal, lsr)
         user_vowels = self.vowels_service.find_vowels(user_signal, usr)
 
+        return self.compare_vowels_accents(lector_signal, lsr, lector_vowels, user_signal, usr, user_vowels)
+
+    def compare_vowels_accents(self, lector_signal, lsr, lector_vowels, user_signal, usr, user_vowels):
         if len(user_vowels) < 2 or len(lector_vowels) < 2:
             return True
 
@@ -127,3 +201,15 @@ class AccentAnalysisService:
     def calculate_correlation_between_energy(energy1, energy2):
         correlation, _ = pearsonr(energy1, energy2)
         return correlation
+
+
+def process_word_pairs_chunk(lector_descriptor, lsr, user_descriptor, usr, word_pairs, chart_encoding=None):
+    lector_memory, lector_audio = SharedAudio.attach(lector_descriptor)
+    user_memory, user_audio = SharedAudio.attach(user_descriptor)
+    try:
+        accent_service = AccentAnalysisService(chart_encoding=chart_encoding)
+        return [accent_service.process_word_pair(lector_audio, lsr, user_audio, usr, *pair) for pair in word_pairs]
+    finally:
+        del lector_audio, user_audio
+        lector_memory.close()
+        user_memory.close()
@@ -1,36 +1,117 @@
+import base64
+import math
+
 import librosa
 import numpy as np
+import soundfile as sf
+import soxr
 from pydub import AudioSegment
 
 
 class AudioService:
+    ANALYSIS_SAMPLE_RATE = 16000
+
+    FLOAT16_ENCODING = 'float16'
+    INT16_ENCODING = 'int16'
+
+    FLAC_FORMAT = 'flac'
+    OPUS_FORMAT = 'opus'
+    TRANSCRIPTION_FORMATS = {
+        FLAC_FORMAT: ('FLAC', 'PCM_16', '.flac'),
+        OPUS_FORMAT: ('OGG', 'OPUS', '.ogg'),
+    }
+    ENCODING_BLOCK_SIZE = 65536
+
+    SEGMENT_PADDING_DURATION = 0.05
+
     @staticmethod
-    def convert_mp3_to_wav(path):
+    def extract_wav(path, wav_file):
         audio = AudioSegment.from_file(path)
-        wav_file = path.replace("mp3", "wav")
         audio.export(wav_file, format="wav")
         return wav_file
 
     @staticmethod
-    def sample_audio_segment_to_draw_chart(audio_segment, num_samples=500):
+    def sample_audio_segment_to_draw_chart(audio_segment, num_samples=500, encoding=None):
+        sampled_audio = AudioService.min_max_envelope(audio_segment, num_samples)
+        return AudioService.encode_chart_samples(sampled_audio, encoding)
+
+    @staticmethod
+    def min_max_envelope(audio_segment, num_samples):
+        audio_segment = np.asarray(audio_segment)
         length = len(audio_segment)
+        buckets_count = num_samples // 2
+
+        if length <= num_samples or buckets_count == 0:
+            return audio_segment
+
+        bucket_size = -(-length // buckets_count)
+        padded_segment = np.pad(audio_segment, (0, buckets_count * bucket_size - length), mode='edge')
+        buckets = padded_segment.reshape(buckets_count, bucket_size)
+
+        min_indices = np.argmin(buckets, axis=1)
+        max_indices = np.argmax(buckets, axis=1)
+        rows = np.arange(buckets_count)
+        min_first = min_indices <= max_indices
 
-        sampled_indices = np.linspace(0, length - 1, num_samples, dtype=int)
-        sampled_audio = audio_segment[sampled_indices]
+        envelope = np.empty((buckets_count, 2), dtype=audio_segment.dtype)
+        envelope[:, 0] = np.where(min_first, buckets[rows, min_indices], buckets[rows, max_indices])
+        envelope[:, 1] = np.where(min_first, buckets[rows, max_indices], buckets[rows, min_indices])
+        return envelope.ravel()
 
-        return sampled_audio.tolist()
+    @staticmethod
+    def encode_chart_samples(samples, encoding=None):
+        if encoding is None:
+            return np.asarray(samples).tolist()
+        if encoding == AudioService.FLOAT16_ENCODING:
+            encoded = np.asarray(samples, dtype='<f2').tobytes()
+        elif encoding == AudioService.INT16_ENCODING:
+            scaled = np.clip(np.round(np.asarray(samples) * 32767), -32768, 32767)
+            encoded = scaled.astype('<i2').tobytes()
+        else:
+            raise ValueError(f"Unknown chart encoding: {encoding}")
+        return base64.b64encode(encoded).decode('ascii')
 
     @staticmethod
-    def load_audio_segment(filepath, start_in_seconds, end_in_seconds):
-        audio, sr = librosa.load(filepath, sr=None)
+    def load_analysis_audio(filepath, sample_rate=ANALYSIS_SAMPLE_RATE):
+        return librosa.load(filepath, sr=sample_rate, mono=True)
 
-        start_time = start_in_seconds
-        end_time = end_in_seconds
+    @staticmethod
+    def encode_for_transcription(filepath, output_filepath, audio_format=FLAC_FORMAT,
+                                 sample_rate=ANALYSIS_SAMPLE_RATE, block_size=ENCODING_BLOCK_SIZE):
+        if audio_format not in AudioService.TRANSCRIPTION_FORMATS:
+            raise ValueError(f"Unknown transcription format: {audio_format}")
+        file_format, subtype, _ = AudioService.TRANSCRIPTION_FORMATS[audio_format]
 
-        start_sample = int(start_time * sr)
-        end_sample = int(end_time * sr)
+        with sf.SoundFile(filepath) as source, \
+                sf.SoundFile(output_filepath, 'w', sample_rate, 1, subtype, format=file_format) as output:
+            resampler = soxr.ResampleStream(source.samplerate, sample_rate, 1, dtype='float32')
+            for block in source.blocks(block_size, dtype='float32', always_2d=True):
+                output.write(resampler.resample_chunk(block.mean(axis=1)))
+            output.write(resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True))
+
+        return output_filepath
+
+    @staticmethod
+    def load_audio_segment(filepath, start_in_seconds, end_in_seconds, sample_rate=None,
+                           padding_duration=SEGMENT_PADDING_DURATION):
+        with sf.SoundFile(filepath) as source:
+            native_sr = source.samplerate
+            sr = sample_rate or native_sr
+            padding = int(padding_duration * native_sr) if sr != native_sr else 0
+            frames_per_step = native_sr // math.gcd(native_sr, sr)
+
+            start_frame = max(int(start_in_seconds * native_sr) - padding, 0)
+            start_frame = min(start_frame - start_frame % frames_per_step, source.frames)
+            end_frame = min(int(math.ceil(end_in_seconds * native_sr)) + padding, source.frames)
+
+            source.seek(start_frame)
+            audio = source.read(max(end_frame - start_frame, 0), dtype='float32', always_2d=True).mean(axis=1)
+
+        if sr != native_sr:
+            audio = soxr.resample(audio, native_sr, sr)
 
-        return audio[start_sample:end_sample], sr
+        offset = int(start_in_seconds * sr) - start_frame * sr // native_sr
+        return audio[max(offset, 0):offset + int(end_in_seconds * sr) - int(start_in_seconds * sr)], sr
 
     @staticmethod
     def extract_segment(audio, start_time, end_time, sr):
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class AutocorrelationEngine:
+    SPEECH_FMIN = 75
+    SPEECH_FMAX = 400
+    PERIODICITY_PERIODS = 2
+    BLOCK_FRAMES = 4096
+
+    @staticmethod
+    def zero_lag_energy(frames):
+        return np.einsum('ij,ij->i', frames, frames)
+
+    @staticmethod
+    def autocorrelation(frames, max_lag=None):
+        frames_count, frame_length = frames.shape
+        max_lag = frame_length - 1 if max_lag is None else min(max_lag, frame_length - 1)
+        if frames_count == 0 or frame_length == 0:
+            return np.zeros((frames_count, max_lag + 1))
+
+        n_fft = 1 << int(frame_length + max_lag).bit_length()
+        spectrum = np.fft.rfft(frames, n=n_fft, axis=1)
+        return np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=n_fft, axis=1)[:, :max_lag + 1]
+
+    @classmethod
+    def periodicity_window_length(cls, sample_rate, fmin=SPEECH_FMIN):
+        return cls.PERIODICITY_PERIODS * int(np.ceil(sample_rate / fmin))
+
+    @classmethod
+    def pitch_lag_range(cls, sample_rate, frame_length, fmin=SPEECH_FMIN, fmax=SPEECH_FMAX):
+        min_lag = max(1, int(np.floor(sample_rate / fmax)))
+        max_lag = min(frame_length // 2, int(np.ceil(sample_rate / fmin)))
+        return min_lag, max_lag
+
+    @classmethod
+    def normalized_autocorrelation(cls, frames, sample_rate, fmin=SPEECH_FMIN, fmax=SPEECH_FMAX):
+        frame_length = frames.shape[1]
+        min_lag, max_lag = cls.pitch_lag_range(sample_rate, frame_length, fmin, fmax)
+        lags = np.arange(min_lag, max_lag + 1)
+        if len(lags) == 0:
+            return lags, np.zeros((len(frames), 0))
+
+        autocorrelation = cls.autocorrelation(frames, max_lag)[:, min_lag:]
+        cumulative_energy = np.zeros((len(frames), frame_length + 1))
+        np.cumsum(np.square(frames), axis=1, out=cumulative_energy[:, 1:])
+        head_energy = cumulative_energy[:, frame_length - lags]
+        tail_energy = cumulative_energy[:, -1:] - cumulative_energy[:, lags]
+        overlap_energy = np.sqrt(head_energy * tail_energy)
+
+        normalized = np.divide(autocorrelation, overlap_energy, out=np.zeros((len(frames), len(lags))),
+                               where=overlap_energy > 0)
+        return lags, normalized
+
+    @classmethod
+    def periodicity(cls, frames, sample_rate, fmin=SPEECH_FMIN, fmax=SPEECH_FMAX):
+        periodicity = np.zeros(len(frames))
+        for block_start in range(0, len(frames), cls.BLOCK_FRAMES):
+            block = frames[block_start:block_start + cls.BLOCK_FRAMES]
+            _, normalized = cls.normalized_autocorrelation(block, sample_rate, fmin, fmax)
+            if normalized.shape[1] > 0:
+                periodicity[block_start:block_start + len(block)] = np.max(normalized, axis=1)
+        return periodicity
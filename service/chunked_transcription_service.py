@@ -0,0 +1,101 @@
+import copy
+import os
+import tempfile
+from concurrent.futures import wait
+
+import numpy as np
+import soundfile as sf
+
+from service.compute_executor import ComputeExecutor
+
+
+class ChunkedTranscriptionService:
+    CHUNK_DURATION = 60.0
+    OVERLAP_DURATION = 2.0
+    SILENCE_SEARCH_DURATION = 10.0
+    FRAME_DURATION = 0.02
+    SILENCE_SMOOTHING_DURATION = 0.2
+
+    def __init__(self, transcript_service, executor=None, chunk_duration=CHUNK_DURATION,
+                 overlap_duration=OVERLAP_DURATION, silence_search_duration=SILENCE_SEARCH_DURATION):
+        self.transcript_service = transcript_service
+        self.executor = executor or ComputeExecutor.get_instance()
+        self.chunk_duration = chunk_duration
+        self.overlap_duration = overlap_duration
+        self.silence_search_duration = silence_search_duration
+
+    def get_words(self, audio_filepath, audio, sr):
+        boundaries = self.find_chunk_boundaries(audio, sr)
+        if len(boundaries) <= 2:
+            transcript = self.transcript_service.get_lector_transcript_data_from_deepgram(audio_filepath)
+            return transcript.results.channels[0].alternatives[0].words
+
+        chunks = self.get_overlapping_chunks(boundaries)
+        with tempfile.TemporaryDirectory() as directory:
+            futures = []
+            for i, (start, end) in enumerate(chunks):
+                chunk_filepath = os.path.join(directory, f'chunk{i}.wav')
+                self.write_chunk(chunk_filepath, audio[int(start * sr):int(end * sr)], sr)
+                futures.append(self.executor.submit_io(
+                    self.transcript_service.get_lector_transcript_data_from_deepgram, chunk_filepath))
+            wait(futures)
+            transcripts = [future.result() for future in futures]
+
+        chunk_words = [transcript.results.channels[0].alternatives[0].words for transcript in transcripts]
+        return self.stitch_words(chunk_words, [start for start, _ in chunks], boundaries)
+
+    def find_chunk_boundaries(self, audio, sr):
+        duration = len(audio) / sr
+        if duration <= self.chunk_duration:
+            return [0.0, duration]
+
+        frame_length = max(int(self.FRAME_DURATION * sr), 1)
+        frames_count = len(audio) // frame_length
+        frames = np.asarray(audio[:frames_count * frame_length], dtype=np.float64).reshape(frames_count, frame_length)
+        smoothing_frames = max(int(self.SILENCE_SMOOTHING_DURATION / self.FRAME_DURATION), 1)
+        energy = np.convolve(np.mean(frames ** 2, axis=1), np.ones(smoothing_frames) / smoothing_frames, mode='same')
+        frame_times = (np.arange(frames_count) + 0.5) * frame_length / sr
+
+        boundaries = [0.0]
+        while duration - boundaries[-1] > self.chunk_duration:
+            target = boundaries[-1] + self.chunk_duration
+            window_start = max(target - self.silence_search_duration, boundaries[-1] + self.chunk_duration / 2)
+            window_end = min(target + self.silence_search_duration, duration)
+
+            window = np.flatnonzero((frame_times >= window_start) & (frame_times <= window_end))
+            if len(window) == 0:
+                boundaries.append(target)
+            else:
+                boundaries.append(float(frame_times[window[np.argmin(energy[window])]]))
+
+        boundaries.append(duration)
+        return boundaries
+
+    def get_overlapping_chunks(self, boundaries):
+        return [(max(start - self.overlap_duration, 0.0), min(end + self.overlap_duration, boundaries[-1]))
+                for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+    @staticmethod
+    def write_chunk(filepath, audio, sr):
+        sf.write(filepath, audio, sr, subtype='PCM_16')
+        return filepath
+
+    @staticmethod
+    def stitch_words(chunk_words, chunk_offsets, boundaries):
+        words = []
+        for i, (words_in_chunk, offset) in enumerate(zip(chunk_words, chunk_offsets)):
+            own_start, own_end = boundaries[i], boundaries[i + 1]
+            is_last_chunk = i == len(chunk_words) - 1
+
+            for word in words_in_chunk:
+                middle = offset + (word.start + word.end) / 2
+                if middle < own_start or middle > own_end or (middle == own_end and not is_last_chunk):
+                    continue
+                if words and words[-1].word == word.word and offset + word.start < words[-1].end:
+                    continue
+
+                shifted_word = copy.copy(word)
+                shifted_word.start += offset
+                shifted_word.end += offset
+                words.append(shifted_word)
+        return words
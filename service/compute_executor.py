@@ -0,0 +1,63 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class ComputeExecutor:
+    IO_WORKERS = 8
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cpu_workers=None, io_workers=None):
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.io_workers = io_workers or self.IO_WORKERS
+        self.worker_state = threading.local()
+
+        self.cpu_executor = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix='compute-cpu',
+                                               initializer=self.mark_cpu_worker)
+        self.io_executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='compute-io')
+
+    def mark_cpu_worker(self):
+        self.worker_state.is_cpu_worker = True
+
+    def in_cpu_worker(self):
+        return getattr(self.worker_state, 'is_cpu_worker', False)
+
+    def submit_cpu(self, function, *args, **kwargs):
+        if self.in_cpu_worker():
+            return self.run_inline(function, *args, **kwargs)
+        return self.cpu_executor.submit(function, *args, **kwargs)
+
+    def submit_io(self, function, *args, **kwargs):
+        return self.io_executor.submit(function, *args, **kwargs)
+
+    @staticmethod
+    def run_inline(function, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait=True):
+        self.cpu_executor.shutdown(wait=wait)
+        self.io_executor.shutdown(wait=wait)
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def configure(cls, cpu_workers=None, io_workers=None):
+        with cls._instance_lock:
+            previous_instance = cls._instance
+            cls._instance = cls(cpu_workers, io_workers)
+
+        if previous_instance is not None:
+            previous_instance.shutdown(wait=False)
+        return cls._instance
@@ -0,0 +1,82 @@
+import numpy as np
+
+
+class DtwAligner:
+    BAND_RATIO = 0.1
+
+    @staticmethod
+    def normalize(sequence):
+        sequence = np.asarray(sequence, dtype=np.float64)
+        std = np.std(sequence)
+        centered = sequence - np.mean(sequence)
+        return centered / std if std > 0 else centered
+
+    @staticmethod
+    def band_limits(n, m, band_width):
+        slope = (m - 1) / (n - 1) if n > 1 else 0
+        band_width = max(band_width, np.ceil(slope), 1)
+
+        centers = np.arange(n) * slope
+        starts = np.clip(np.ceil(centers - band_width), 0, m - 1).astype(np.int64)
+        ends = np.clip(np.floor(centers + band_width) + 1, 1, m).astype(np.int64)
+        ends[-1] = m
+        return starts, ends
+
+    @classmethod
+    def accumulated_cost(cls, x, y, starts, ends):
+        width = int(np.max(ends - starts))
+        cost = np.full((len(x), width), np.inf)
+
+        row_costs = np.abs(x[0] - y[starts[0]:ends[0]])
+        cost[0, :len(row_costs)] = np.cumsum(row_costs)
+
+        for i in range(1, len(x)):
+            start, end = starts[i], ends[i]
+            previous_start, previous_end = starts[i - 1], ends[i - 1]
+            columns = np.arange(start, end)
+
+            previous_row = np.full(end - start + 1, np.inf)
+            overlap = np.arange(max(start - 1, previous_start), min(end, previous_end))
+            previous_row[overlap - start + 1] = cost[i - 1, overlap - previous_start]
+
+            row_costs = np.abs(x[i] - y[start:end])
+            best_previous = np.minimum(previous_row[1:], previous_row[:-1])
+            prefix_sums = np.cumsum(row_costs)
+
+            entry_costs = row_costs + best_previous - prefix_sums
+            cost[i, :len(columns)] = np.minimum.accumulate(entry_costs) + prefix_sums
+
+        return cost
+
+    @staticmethod
+    def warping_path(cost, starts, ends):
+        def cell(i, j):
+            if i < 0 or j < starts[i] or j >= ends[i]:
+                return np.inf
+            return cost[i, j - starts[i]]
+
+        i, j = len(starts) - 1, ends[-1] - 1
+        path = [(i, j)]
+        while i > 0 or j > 0:
+            candidates = [(cell(i - 1, j - 1), i - 1, j - 1), (cell(i - 1, j), i - 1, j), (cell(i, j - 1), i, j - 1)]
+            _, i, j = min(candidates, key=lambda candidate: candidate[0])
+            path.append((i, j))
+
+        path.reverse()
+        path = np.array(path)
+        return path[:, 0], path[:, 1]
+
+    @classmethod
+    def align(cls, sequence1, sequence2, band_ratio=BAND_RATIO):
+        sequence1 = np.asarray(sequence1)
+        sequence2 = np.asarray(sequence2)
+        if len(sequence1) < 2 or len(sequence2) < 2:
+            return sequence1, sequence2
+
+        x = cls.normalize(sequence1)
+        y = cls.normalize(sequence2)
+
+        starts, ends = cls.band_limits(len(x), len(y), band_ratio * max(len(x), len(y)))
+        cost = cls.accumulated_cost(x, y, starts, ends)
+        path1, path2 = cls.warping_path(cost, starts, ends)
+        return sequence1[path1], sequence2[path2]
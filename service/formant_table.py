@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class FormantTable:
+    def __init__(self, times, f1, f2, offsets):
+        self.times = times
+        self.f1 = f1
+        self.f2 = f2
+        self.offsets = offsets
+
+    @property
+    def vowels_count(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def vowel(self, index):
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.times[start:end], self.f1[start:end], self.f2[start:end]
+
+    @staticmethod
+    def ragged_offsets(lengths):
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return offsets
+
+    @classmethod
+    def from_track(cls, formant_track, spans, time_step):
+        track_times, track_f1, track_f2 = formant_track
+        spans = np.asarray(spans, dtype=np.float64).reshape(-1, 2)
+
+        counts = np.maximum(np.ceil((spans[:, 1] - spans[:, 0]) / time_step), 0).astype(np.int64)
+        offsets = cls.ragged_offsets(counts)
+        span_ids = np.repeat(np.arange(len(spans)), counts)
+        local_indices = np.arange(offsets[-1]) - offsets[span_ids]
+        times = spans[span_ids, 0] + local_indices * time_step
+
+        if len(track_times) == 0:
+            return cls(times[:0], times[:0], times[:0], np.zeros(len(spans) + 1, dtype=np.int64))
+
+        f1 = np.interp(times, track_times, track_f1, left=np.nan, right=np.nan)
+        f2 = np.interp(times, track_times, track_f2, left=np.nan, right=np.nan)
+
+        valid = ~np.isnan(f1) & ~np.isnan(f2)
+        valid_counts = np.bincount(span_ids[valid], minlength=len(spans))
+        return cls(times[valid], f1[valid], f2[valid], cls.ragged_offsets(valid_counts))
+
+    def lobanov_normalized(self):
+        return FormantTable(self.times, self.standardize(self.f1), self.standardize(self.f2), self.offsets)
+
+    @staticmethod
+    def standardize(values):
+        if len(values) == 0:
+            return values
+        std = np.std(values)
+        return (values - np.mean(values)) / std if std else np.zeros_like(values)
+
+    def resample(self, values, target_lengths):
+        lengths = self.lengths
+        target_offsets = self.ragged_offsets(target_lengths)
+        target_ids = np.repeat(np.arange(len(target_lengths)), target_lengths)
+        target_indices = np.arange(target_offsets[-1]) - target_offsets[target_ids]
+
+        source_lengths = lengths[target_ids]
+        steps = np.divide(source_lengths - 1, target_lengths[target_ids] - 1,
+                          out=np.zeros(len(target_ids)), where=target_lengths[target_ids] > 1)
+        positions = target_indices * steps
+
+        lower = np.minimum(np.floor(positions).astype(np.int64), source_lengths - 1)
+        upper = np.minimum(lower + 1, source_lengths - 1)
+        fractions = positions - lower
+
+        start = self.offsets[target_ids]
+        return values[start + lower] * (1 - fractions) + values[start + upper] * fractions
+
+    @staticmethod
+    def segment_correlations(x, y, lengths):
+        correlations = np.full(len(lengths), np.nan)
+        non_empty = lengths > 0
+        if not np.any(non_empty):
+            return correlations
+
+        starts = FormantTable.ragged_offsets(lengths)[:-1][non_empty]
+        segment_lengths = lengths[non_empty]
+        segment_ids = np.repeat(np.arange(len(starts)), segment_lengths)
+
+        centered_x = x - (np.add.reduceat(x, starts) / segment_lengths)[segment_ids]
+        centered_y = y - (np.add.reduceat(y, starts) / segment_lengths)[segment_ids]
+
+        covariance = np.add.reduceat(centered_x * centered_y, starts)
+        variance = np.add.reduceat(centered_x ** 2, starts) * np.add.reduceat(centered_y ** 2, starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            correlations[non_empty] = covariance / np.sqrt(variance)
+        return correlations
+
+    @classmethod
+    def pair_correlations(cls, table1, table2):
+        paired = (table1.lengths > 0) & (table2.lengths > 0)
+        target_lengths = np.where(paired, np.maximum(table1.lengths, table2.lengths), 0)
+
+        f1_correlations = cls.segment_correlations(table1.resample(table1.f1, target_lengths),
+                                                   table2.resample(table2.f1, target_lengths), target_lengths)
+        f2_correlations = cls.segment_correlations(table1.resample(table1.f2, target_lengths),
+                                                   table2.resample(table2.f2, target_lengths), target_lengths)
+        return f1_correlations, f2_correlations
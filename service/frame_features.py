@@ -0,0 +1,170 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from service.autocorrelation_engine import AutocorrelationEngine
+
+
+class FrameFeatures:
+    ZERO_CROSSING_THRESHOLD = 1e-10
+
+    def __init__(self, audio_signal, sample_rate, frame_duration=0.01):
+        self.sample_rate = sample_rate
+        self.frame_length = int(frame_duration * sample_rate)
+        self.hop_length = self.frame_length
+        self.signal_length = len(audio_signal)
+
+        self.audio_signal = audio_signal
+        self.frames = self.frame_signal(audio_signal, self.frame_length, self.hop_length)
+
+        self.rms = self.calculate_centered_rms(audio_signal, self.frame_length, self.hop_length)
+        self.zcr = self.calculate_centered_zcr(audio_signal, self.frame_length, self.hop_length)
+        self.energy = AutocorrelationEngine.zero_lag_energy(self.frames)
+        self._periodicity = None
+
+    @property
+    def frames_count(self):
+        return len(self.frames)
+
+    @property
+    def periodicity(self):
+        if self._periodicity is None:
+            window_length = AutocorrelationEngine.periodicity_window_length(self.sample_rate)
+            windows = self.frame_centered_windows(self.audio_signal, self.frame_length, self.hop_length,
+                                                  window_length, self.frames_count)
+            self._periodicity = AutocorrelationEngine.periodicity(windows, self.sample_rate)
+        return self._periodicity
+
+    @staticmethod
+    def frame_signal(audio_signal, frame_length, hop_length):
+        frames_count = len(range(0, len(audio_signal) - frame_length, hop_length))
+        if frames_count <= 0:
+            return np.zeros((0, max(frame_length, 0)), dtype=audio_signal.dtype)
+
+        return sliding_window_view(audio_signal, frame_length)[:frames_count * hop_length:hop_length]
+
+    @staticmethod
+    def frame_centered_windows(audio_signal, frame_length, hop_length, window_length, frames_count):
+        left_padding = max((window_length - frame_length) // 2, 0)
+        padded_signal = np.pad(audio_signal, (left_padding, window_length), mode='constant')
+        return sliding_window_view(padded_signal, window_length)[:frames_count * hop_length:hop_length]
+
+    @staticmethod
+    def calculate_centered_rms(audio_signal, frame_length, hop_length):
+        half_frame = frame_length // 2
+        padded_signal = np.pad(audio_signal, (half_frame, half_frame), mode='constant')
+        if len(padded_signal) < frame_length:
+            return np.zeros(0, dtype=audio_signal.dtype)
+
+        centered_frames = sliding_window_view(padded_signal, frame_length)[::hop_length]
+
+        power = np.mean(np.square(centered_frames.T), axis=0)
+        return np.sqrt(power)
+
+    @classmethod
+    def calculate_centered_zcr(cls, audio_signal, frame_length, hop_length):
+        half_frame = frame_length // 2
+        signal_length = len(audio_signal)
+        padded_length = signal_length + 2 * half_frame
+        if padded_length < frame_length:
+            return np.zeros(0)
+
+        negative = audio_signal < -cls.ZERO_CROSSING_THRESHOLD
+        crossings = np.zeros(signal_length + 1, dtype=np.int64)
+        crossings[2:] = np.cumsum(negative[1:] != negative[:-1])
+
+        frame_starts = np.arange(0, padded_length - frame_length + 1, hop_length) - half_frame
+        first_counted = np.clip(frame_starts + 1, 0, signal_length)
+        last_counted = np.clip(frame_starts + frame_length, 0, signal_length)
+
+        return (crossings[last_counted] - crossings[first_counted]) / frame_length
+
+
+class SpanFrameFeatures:
+    def __init__(self, audio_signal, sample_rate, spans, frame_duration=0.01):
+        self.sample_rate = sample_rate
+        self.frame_length = int(frame_duration * sample_rate)
+        self.spans_count = len(spans)
+
+        signal_length = len(audio_signal)
+        self.segment_starts = np.array([min(max(int(start * sample_rate), 0), signal_length) for start, _ in spans],
+                                       dtype=np.int64)
+        self.segment_ends = np.array([min(max(int(end * sample_rate), 0), signal_length) for _, end in spans],
+                                     dtype=np.int64)
+        self.segment_ends = np.maximum(self.segment_ends, self.segment_starts)
+        self.segment_lengths = self.segment_ends - self.segment_starts
+
+        self.squares = np.zeros(signal_length + 1, dtype=np.float32)
+        np.square(audio_signal, out=self.squares[:-1])
+
+        negative = audio_signal < -FrameFeatures.ZERO_CROSSING_THRESHOLD
+        self.crossing_positions = np.flatnonzero(negative[1:] != negative[:-1]) + 1
+
+        self.calculate_centered_features()
+        self.calculate_frame_features()
+
+    @staticmethod
+    def expand(counts):
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        span_ids = np.repeat(np.arange(len(counts)), counts)
+        local_indices = np.arange(len(span_ids)) - offsets[span_ids]
+        return offsets, span_ids, local_indices
+
+    def sum_squares(self, first_samples, last_samples):
+        if len(first_samples) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        bounds = np.empty(2 * len(first_samples), dtype=np.int64)
+        bounds[0::2] = first_samples
+        bounds[1::2] = last_samples
+
+        sums = np.add.reduceat(self.squares, bounds)[0::2]
+        sums[last_samples <= first_samples] = 0
+        return sums
+
+    def count_crossings(self, first_counted, last_counted):
+        return (np.searchsorted(self.crossing_positions, last_counted) -
+                np.searchsorted(self.crossing_positions, first_counted))
+
+    def span_means(self, values, span_ids):
+        sums = np.bincount(span_ids, weights=values, minlength=self.spans_count)
+        counts = np.bincount(span_ids, minlength=self.spans_count)
+        return np.divide(sums, counts, out=np.zeros(self.spans_count), where=counts > 0)
+
+    def calculate_centered_features(self):
+        frame_length = self.frame_length
+        half_frame = frame_length // 2
+
+        centered_counts = np.maximum(0, 1 + (self.segment_lengths + 2 * half_frame - frame_length) // frame_length)
+        self.centered_offsets, span_ids, local_indices = self.expand(centered_counts)
+
+        segment_starts = self.segment_starts[span_ids]
+        segment_ends = self.segment_ends[span_ids]
+        frame_starts = segment_starts + local_indices * frame_length - half_frame
+
+        first_sample = np.clip(frame_starts, segment_starts, segment_ends)
+        last_sample = np.clip(frame_starts + frame_length, segment_starts, segment_ends)
+        self.centered_rms = np.sqrt(self.sum_squares(first_sample, last_sample) / frame_length)
+
+        first_counted = np.clip(frame_starts + 1, segment_starts + 1, segment_ends)
+        last_counted = np.clip(frame_starts + frame_length, segment_starts + 1, segment_ends)
+        crossings = self.count_crossings(first_counted, np.maximum(last_counted, first_counted))
+        self.centered_zcr = crossings / frame_length
+
+        self.rms_thresholds = self.span_means(self.centered_rms, span_ids)
+        self.zcr_thresholds = self.span_means(self.centered_zcr, span_ids)
+
+    def calculate_frame_features(self):
+        frame_length = self.frame_length
+
+        lengths_after_first_frame = np.maximum(self.segment_lengths - frame_length, 0)
+        frames_counts = -(-lengths_after_first_frame // frame_length)
+        self.frames_counts = frames_counts
+        self.frame_offsets, self.frame_span_ids, self.frame_local_indices = self.expand(frames_counts)
+
+        frame_starts = self.segment_starts[self.frame_span_ids] + self.frame_local_indices * frame_length
+        self.energy = self.sum_squares(frame_starts, frame_starts + frame_length)
+        self.energy_thresholds = self.span_means(self.energy, self.frame_span_ids)
+
+        centered_indices = self.centered_offsets[self.frame_span_ids] + self.frame_local_indices
+        self.rms = self.centered_rms[centered_indices]
+        self.zcr = self.centered_zcr[centered_indices]
@@ -0,0 +1,80 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from service.compute_executor import ComputeExecutor
+
+
+class IngestPipeline:
+    CPU_STAGE = 'cpu'
+    IO_STAGE = 'io'
+
+    def __init__(self, executor=None):
+        self.executor = executor or ComputeExecutor.get_instance()
+        self.stages = {}
+        self.background_futures = {}
+        self.timings = {}
+        self.lock = threading.Lock()
+
+    def add_stage(self, name, function, dependencies=(), kind=IO_STAGE, background=False):
+        if kind not in (self.CPU_STAGE, self.IO_STAGE):
+            raise ValueError(f"Unknown stage kind: {kind}")
+        for dependency in dependencies:
+            if dependency not in self.stages:
+                raise ValueError(f"Unknown stage dependency: {dependency}")
+            if self.stages[dependency][3]:
+                raise ValueError(f"Background stage cannot be a dependency: {dependency}")
+
+        self.stages[name] = (function, tuple(dependencies), kind, background)
+        return self
+
+    def run(self):
+        pipeline_start = time.perf_counter()
+        results = {}
+        waiting = list(self.stages)
+        running = {}
+        failure = None
+
+        with ThreadPoolExecutor(max_workers=max(len(self.stages), 1), thread_name_prefix='ingest') as stage_pool:
+            while waiting or running:
+                if failure is None:
+                    for name in list(waiting):
+                        function, dependencies, kind, background = self.stages[name]
+                        if all(dependency in results for dependency in dependencies):
+                            waiting.remove(name)
+                            inputs = [results[dependency] for dependency in dependencies]
+                            if background:
+                                submit = self.executor.submit_cpu if kind == self.CPU_STAGE else self.executor.submit_io
+                                self.background_futures[name] = submit(self.run_stage, name, function, inputs,
+                                                                       pipeline_start)
+                                continue
+                            submit = self.executor.submit_cpu if kind == self.CPU_STAGE else stage_pool.submit
+                            running[submit(self.run_stage, name, function, inputs, pipeline_start)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        failure = failure or future.exception()
+                    else:
+                        results[name] = future.result()
+
+        if failure is not None:
+            raise failure
+        return results
+
+    def run_stage(self, name, function, inputs, pipeline_start):
+        stage_start = time.perf_counter()
+        try:
+            return function(*inputs)
+        finally:
+            with self.lock:
+                self.timings[name] = {'start': round(stage_start - pipeline_start, 3),
+                                      'duration': round(time.perf_counter() - stage_start, 3)}
+
+    def get_timings(self):
+        with self.lock:
+            return dict(self.timings)
@@ -1,42 +1,61 @@
-import librosa
 import numpy as np
 from scipy.interpolate import interp1d
 from scipy.stats import pearsonr
 
 from service.audio_service import AudioService
-from service.thread_helper import ThreadHelper
+from service.compute_executor import ComputeExecutor
+from service.dtw_aligner import DtwAligner
+from service.pitch_backends import PraatPitchBackend, PyinPitchBackend, YinPitchBackend
 
 
 class IntonationAnalysisService:
+    PYIN_BACKEND = 'pyin'
+    YIN_BACKEND = 'yin'
+    PRAAT_BACKEND = 'praat'
+    PITCH_BACKENDS = {
+        PYIN_BACKEND: PyinPitchBackend,
+        YIN_BACKEND: YinPitchBackend,
+        PRAAT_BACKEND: PraatPitchBackend,
+    }
+
+    INTERPOLATION_MODE = 'interpolation'
+    DTW_MODE = 'dtw'
+
+    def __init__(self, pitch_backend=PYIN_BACKEND, executor=None, comparison_mode=INTERPOLATION_MODE,
+                 dtw_band_ratio=DtwAligner.BAND_RATIO):
+        if pitch_backend not in self.PITCH_BACKENDS:
+            raise ValueError(f"Unknown pitch backend: {pitch_backend}")
+        if comparison_mode not in (self.INTERPOLATION_MODE, self.DTW_MODE):
+            raise ValueError(f"Unknown comparison mode: {comparison_mode}")
+        self.comparison_mode = comparison_mode
+        self.dtw_band_ratio = dtw_band_ratio
 
-    def __init__(self):
         self.audio_service = AudioService()
-        self.thread_helper = ThreadHelper()
+        self.executor = executor or ComputeExecutor.get_instance()
+        self.pitch_backend = self.PITCH_BACKENDS[pitch_backend]()
 
-    def get_intonation_success_rate(self, lector_signal, user_signal):
-        self.thread_helper.run_in_threads(self.get_pitch_array, (lector_signal,), 'pitch1')
-        self.thread_helper.run_in_threads(self.get_pitch_array, (user_signal,), 'pitch2')
+    def get_intonation_success_rate(self, lector_signal, lector_sr, user_signal, user_sr, lector_pitch=None):
+        if lector_pitch is None:
+            lector_pitch_future = self.executor.submit_cpu(self.get_pitch_array, lector_signal, lector_sr)
+        user_pitch_future = self.executor.submit_cpu(self.get_pitch_array, user_signal, user_sr)
 
-        self.thread_helper.wait_for_completion()
+        pitch1 = lector_pitch_future.result() if lector_pitch is None else lector_pitch
+        pitch2 = user_pitch_future.result()
 
-        pitch1 = self.thread_helper.results['pitch1']
-        pitch2 = self.thread_helper.results['pitch2']
+        return self.compare_pitch_contours(pitch1, pitch2)
 
-        self.thread_helper.run_in_threads(self.filter, (pitch1,), 'filtered_pitch1')
-        self.thread_helper.run_in_threads(self.filter, (pitch2,), 'filtered_pitch2')
+    def compare_pitch_contours(self, pitch1, pitch2):
+        filtered_pitch1 = self.filter(pitch1)
+        filtered_pitch2 = self.filter(pitch2)
 
-        self.thread_helper.wait_for_completion()
-
-        filtered_pitch1 = self.thread_helper.results['filtered_pitch1']
-        filtered_pitch2 = self.thread_helper.results['filtered_pitch2']
-
-        self.thread_helper.threads.clear()
-
-        pitch_interpolated1, pitch_interpolated2 = self.interpolate(filtered_pitch1, filtered_pitch2)
+        if self.comparison_mode == self.DTW_MODE:
+            pitch_aligned1, pitch_aligned2 = DtwAligner.align(filtered_pitch1, filtered_pitch2, self.dtw_band_ratio)
+        else:
+            pitch_aligned1, pitch_aligned2 = self.interpolate(filtered_pitch1, filtered_pitch2)
 
         sampling_rate = 10
-        processed1 = self.calculate_amplitude_rate(pitch_interpolated1, sampling_rate)
-        processed2 = self.calculate_amplitude_rate(pitch_interpolated2, sampling_rate)
+        processed1 = self.calculate_amplitude_rate(pitch_aligned1, sampling_rate)
+        processed2 = self.calculate_amplitude_rate(pitch_aligned2, sampling_rate)
 
         correlation = self.calculate_correlation_between_pitches(processed1, processed2)
         similarity = max((correlation + 1) / 2, 0.05)
@@ -59,14 +78,26 @@ class IntonationAnalysisService:
         threshold = 2 * std_dev
         return pitch[(pitch >= mean_pitch - threshold) & (pitch <= mean_pitch + threshold)]
 
-    @staticmethod
-    def get_pitch_array(audio):
-        fmin = librosa.note_to_hz('C2')
-        fmax = librosa.note_to_hz('C7')
-        f0, _, _ = librosa.pyin(audio, fmin=fmin, fmax=fmax)
+    def get_pitch_array(self, audio, sr):
+        f0 = self.get_pitch_track(audio, sr)
         f0_valid = f0[~np.isnan(f0)]
         return f0_valid
 
+    def get_pitch_track(self, audio, sr):
+        _, f0 = self.get_pitch_track_with_times(audio, sr)
+        return f0
+
+    def get_pitch_track_with_times(self, audio, sr):
+        return self.pitch_backend.get_pitch_track(audio, sr)
+
+    def get_lesson_pitch_track(self, audio, sr):
+        return self.pitch_backend.get_windowed_pitch_track(audio, sr)
+
+    @staticmethod
+    def slice_pitch_track(times, f0, start_in_seconds, end_in_seconds):
+        start_index, end_index = np.searchsorted(times, [start_in_seconds, end_in_seconds])
+        f0_segment = f0[start_index:end_index]
+        return f0_segment[~np.isnan(f0_segment)]
 
     @staticmethod
     def interpolate_sequence(sequence, target_length):
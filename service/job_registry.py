@@ -0,0 +1,50 @@
+import threading
+import uuid
+from collections import OrderedDict
+
+from service.compute_executor import ComputeExecutor
+
+
+class JobRegistry:
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    MAX_JOBS = 100
+
+    def __init__(self, executor=None, max_jobs=MAX_JOBS):
+        self.executor = executor or ComputeExecutor.get_instance()
+        self.max_jobs = max_jobs
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args, **kwargs):
+        job_id = uuid.uuid4().hex
+        future = self.executor.submit_cpu(function, *args, **kwargs)
+
+        with self.lock:
+            self.jobs[job_id] = future
+            self.evict_finished_jobs()
+        return job_id
+
+    def evict_finished_jobs(self):
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= self.max_jobs:
+                break
+            if self.jobs[job_id].done():
+                del self.jobs[job_id]
+
+    def get_status(self, job_id):
+        with self.lock:
+            future = self.jobs.get(job_id)
+
+        if future is None:
+            return None, None
+        if not future.done():
+            return self.PENDING, None
+
+        exception = future.exception()
+        if exception is not None:
+            print(f"Job {job_id} failed: {exception}")
+            return self.FAILED, None
+        return self.DONE, future.result()
@@ -0,0 +1,97 @@
+import os
+import threading
+from concurrent.futures import Future
+
+from pytubefix.extract import video_id as extract_video_id
+
+
+class LessonFiles:
+    def __init__(self, directory):
+        self.directory = directory
+        self.audio_file_path_wav = os.path.join(directory, 'lector_audio.wav')
+        self.words_file_path = os.path.join(directory, 'lector_words.json')
+        self.pauses_file_path = os.path.join(directory, 'lector_pauses.json')
+        self.analysis_audio_file_path = os.path.join(directory, 'lector_analysis_audio.npy')
+        self.pitch_file_path = os.path.join(directory, 'lector_pitch.npz')
+        self.video_file_path = os.path.join(directory, 'lector_video.mp4')
+        self.ingest_timings_file_path = os.path.join(directory, 'ingest_timings.json')
+
+    def partial_file_path(self, artifact):
+        return os.path.join(self.directory, f'.{artifact}.part')
+
+
+class LessonStore:
+    VIDEO_ARTIFACT = 'video'
+    AUDIO_ARTIFACT = 'audio'
+
+    def __init__(self, root='./lessons'):
+        self.root = os.path.abspath(root)
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.counters = {'hits': 0, 'ingests': 0, 'coalesced': 0, 'failures': 0}
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def get_video_id(youtube_url):
+        return extract_video_id(youtube_url)
+
+    def get_lesson_files(self, video_id):
+        directory = os.path.join(self.root, video_id)
+        os.makedirs(directory, exist_ok=True)
+        return LessonFiles(directory)
+
+    def marker_path(self, video_id, artifact):
+        return os.path.join(self.root, video_id, f'.{artifact}.done')
+
+    def is_ingested(self, video_id, artifact):
+        return os.path.exists(self.marker_path(video_id, artifact))
+
+    def ensure(self, video_id, artifact, ingest):
+        lesson_files, future = self.start(video_id, artifact, ingest)
+        future.result()
+        return lesson_files
+
+    def start(self, video_id, artifact, ingest, submit=None):
+        lesson_files = self.get_lesson_files(video_id)
+        key = (video_id, artifact)
+
+        with self.lock:
+            if self.is_ingested(video_id, artifact):
+                self.counters['hits'] += 1
+                future = Future()
+                future.set_result(lesson_files)
+                return lesson_files, future
+
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.counters['coalesced'] += 1
+                return lesson_files, future
+
+            future = self.in_flight[key] = Future()
+            self.counters['ingests'] += 1
+            if os.path.exists(lesson_files.partial_file_path(artifact)):
+                os.remove(lesson_files.partial_file_path(artifact))
+
+        if submit is None:
+            self.run_ingest(video_id, artifact, ingest, lesson_files, future)
+        else:
+            submit(self.run_ingest, video_id, artifact, ingest, lesson_files, future)
+        return lesson_files, future
+
+    def run_ingest(self, video_id, artifact, ingest, lesson_files, future):
+        try:
+            ingest(lesson_files)
+            with open(self.marker_path(video_id, artifact), 'w'):
+                pass
+            future.set_result(lesson_files)
+        except Exception as e:
+            with self.lock:
+                self.counters['failures'] += 1
+            future.set_exception(e)
+        finally:
+            with self.lock:
+                del self.in_flight[(video_id, artifact)]
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.counters)
@@ -0,0 +1,54 @@
+import os
+import time
+
+
+class GrowingFileStream:
+    CHUNK_SIZE = 64 * 1024
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, filepath, download, chunk_size=CHUNK_SIZE, poll_interval=POLL_INTERVAL):
+        self.filepath = filepath
+        self.download = download
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.file = None
+
+    def open(self):
+        while self.file is None:
+            try:
+                self.file = open(self.filepath, 'rb')
+            except FileNotFoundError:
+                if self.download.done():
+                    return False
+                time.sleep(self.poll_interval)
+        return True
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def is_complete(self):
+        if not self.download.done():
+            return False
+        if self.download.exception() is not None:
+            raise IOError(f"Streamed file download failed: {self.filepath}") from self.download.exception()
+        return True
+
+    def __iter__(self):
+        if not self.open():
+            return
+        try:
+            while True:
+                is_complete = self.is_complete()
+                chunk = self.file.read(self.chunk_size)
+                if chunk:
+                    yield chunk
+                elif is_complete:
+                    return
+                elif os.fstat(self.file.fileno()).st_size < self.file.tell():
+                    raise IOError(f"Streamed file was truncated: {self.filepath}")
+                else:
+                    time.sleep(self.poll_interval)
+        finally:
+            self.close()
@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+import librosa
+import numpy as np
+import parselmouth
+
+
+class PitchBackend(ABC):
+    FMIN = 65.0
+    FMAX = 500.0
+    HOP_DURATION = 512 / 44100
+    FRAME_DURATION = 2048 / 44100
+    WINDOW_DURATION = 30.0
+
+    def __init__(self, fmin=None, fmax=None, hop_duration=None, frame_duration=None):
+        self.fmin = self.FMIN if fmin is None else fmin
+        self.fmax = self.FMAX if fmax is None else fmax
+        self.hop_duration = self.HOP_DURATION if hop_duration is None else hop_duration
+        self.frame_duration = self.FRAME_DURATION if frame_duration is None else frame_duration
+
+    @abstractmethod
+    def get_pitch_track(self, audio, sr):
+        pass
+
+    def get_windowed_pitch_track(self, audio, sr, window_duration=WINDOW_DURATION):
+        hop_length = self.hop_length(sr)
+        window_length = max(1, int(round(window_duration * sr / hop_length))) * hop_length
+        context_length = int(np.ceil(self.frame_length(sr) / hop_length)) * hop_length
+
+        times, f0 = [np.zeros(0)], [np.zeros(0)]
+        for window_start in range(0, len(audio), window_length):
+            window_end = window_start + window_length if window_start + window_length < len(audio) else np.inf
+            context_start = max(window_start - context_length, 0)
+            window = np.asarray(audio[context_start:window_start + window_length + context_length], dtype=np.float32)
+
+            window_times, window_f0 = self.get_pitch_track(window, sr)
+            frame_positions = np.round(np.asarray(window_times) * sr) + context_start
+            kept = (frame_positions >= window_start) & (frame_positions < window_end)
+            times.append(np.asarray(window_times)[kept] + context_start / sr)
+            f0.append(np.asarray(window_f0)[kept])
+
+        return np.concatenate(times), np.concatenate(f0)
+
+    def hop_length(self, sr):
+        return max(1, int(round(self.hop_duration * sr)))
+
+    def frame_length(self, sr):
+        return 1 << int(np.ceil(np.log2(self.frame_duration * sr)))
+
+    def frame_times(self, frames_count, sr):
+        return librosa.frames_to_time(np.arange(frames_count), sr=sr, hop_length=self.hop_length(sr))
+
+
+class PyinPitchBackend(PitchBackend):
+    def get_pitch_track(self, audio, sr):
+        f0, _, _ = librosa.pyin(audio, fmin=self.fmin, fmax=self.fmax, sr=sr, frame_length=self.frame_length(sr),
+                                hop_length=self.hop_length(sr))
+        return self.frame_times(len(f0), sr), f0
+
+
+class YinPitchBackend(PitchBackend):
+    VOICED_RMS_RATIO = 0.1
+
+    def get_pitch_track(self, audio, sr):
+        frame_length = self.frame_length(sr)
+        hop_length = self.hop_length(sr)
+
+        f0 = librosa.yin(audio, fmin=self.fmin, fmax=self.fmax, sr=sr, frame_length=frame_length,
+                         hop_length=hop_length)
+        rms = librosa.feature.rms(y=audio, frame_length=frame_length, hop_length=hop_length)[0]
+
+        f0 = f0.astype(np.float64)
+        f0[rms < self.VOICED_RMS_RATIO * np.max(rms, initial=0)] = np.nan
+        return self.frame_times(len(f0), sr), f0
+
+
+class PraatPitchBackend(PitchBackend):
+    FMIN = 75.0
+
+    def get_pitch_track(self, audio, sr):
+        sound = parselmouth.Sound(np.asarray(audio, dtype=np.float64), sampling_frequency=sr)
+        pitch = sound.to_pitch(time_step=self.hop_duration, pitch_floor=self.fmin, pitch_ceiling=self.fmax)
+
+        f0 = pitch.selected_array['frequency']
+        f0[f0 == 0] = np.nan
+        return pitch.xs(), f0
@@ -0,0 +1,40 @@
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class SharedAudio:
+    def __init__(self, audio_signal):
+        audio_signal = np.ascontiguousarray(audio_signal)
+        self.shape = audio_signal.shape
+        self.dtype = audio_signal.dtype.str
+
+        self.shared_memory = shared_memory.SharedMemory(create=True, size=max(audio_signal.nbytes, 1))
+        shared_signal = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shared_memory.buf)
+        shared_signal[:] = audio_signal
+
+    @property
+    def descriptor(self):
+        return self.shared_memory.name, self.shape, self.dtype
+
+    def close(self):
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def ensure_tracker_running():
+        # Workers started after this share the parent's tracker, so attaching
+        # to a block does not make the worker unlink it when it exits.
+        resource_tracker.ensure_running()
+
+    @staticmethod
+    def attach(descriptor):
+        name, shape, dtype = descriptor
+        attached_memory = shared_memory.SharedMemory(name=name)
+        return attached_memory, np.ndarray(shape, dtype=dtype, buffer=attached_memory.buf)
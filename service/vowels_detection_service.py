@@ -4,10 +4,124 @@ import parselmouth
 from librosa import feature
 import soundfile as sf
 
+from service.autocorrelation_engine import AutocorrelationEngine
+from service.frame_features import FrameFeatures, SpanFrameFeatures
+
 
 class VowelsDetectionService:
+    LOOP_ENGINE = 'loop'
+    MASK_ENGINE = 'mask'
+
+    VOICING_THRESHOLD = 0.4
+
+    def __init__(self, engine=MASK_ENGINE, use_periodicity=False):
+        if engine not in (self.LOOP_ENGINE, self.MASK_ENGINE):
+            raise ValueError(f"Unknown vowel detection engine: {engine}")
+        if use_periodicity and engine != self.MASK_ENGINE:
+            raise ValueError("Periodicity criterion is only available in the mask engine")
+        self.engine = engine
+        self.use_periodicity = use_periodicity
 
     def find_vowels(self, audio_signal, sample_rate, frame_length=0.001):
+        if self.engine == self.MASK_ENGINE:
+            return self.find_vowels_with_masks(audio_signal, sample_rate, frame_length)
+        return self.find_vowels_with_loop(audio_signal, sample_rate, frame_length)
+
+    def create_stream_detector(self, sample_rate, warmup_frames=50):
+        return StreamingVowelsDetector(self, sample_rate, warmup_frames)
+
+    @staticmethod
+    def extract_frame_features(audio_signal, sample_rate):
+        return FrameFeatures(audio_signal, sample_rate)
+
+    def find_vowels_with_masks(self, audio_signal, sample_rate, frame_length=0.001):
+        frame_features = self.extract_frame_features(audio_signal, sample_rate)
+
+        hop_length = int(frame_length * sample_rate)
+
+        frame_masks = [
+            self.high_rms_frame_mask(frame_features),
+            self.low_zcr_frame_mask(frame_features),
+            self.periodicity_frame_mask(frame_features) if self.use_periodicity
+            else self.high_autocorrelation_frame_mask(frame_features),
+        ]
+
+        hop_starts = np.arange(0, len(audio_signal), hop_length)
+        frame_indices = hop_starts // frame_features.frame_length
+
+        vowel_mask = np.ones(len(hop_starts), dtype=bool)
+        for frame_mask in frame_masks:
+            in_range = frame_indices < len(frame_mask)
+            hop_mask = np.zeros(len(hop_starts), dtype=bool)
+            hop_mask[in_range] = frame_mask[frame_indices[in_range]]
+            vowel_mask &= hop_mask
+
+        run_starts, run_ends = self.mask_to_runs(vowel_mask)
+
+        return [(int(hop_starts[start]) / sample_rate, (int(hop_starts[end - 1]) + hop_length) / sample_rate)
+                for start, end in zip(run_starts, run_ends)]
+
+    def find_vowels_for_spans(self, audio_signal, sample_rate, spans, frame_length=0.001):
+        span_features = SpanFrameFeatures(audio_signal, sample_rate, spans)
+        span_ids = span_features.frame_span_ids
+        local_indices = span_features.frame_local_indices
+
+        hop_length = int(frame_length * sample_rate)
+
+        frame_masks = [
+            span_features.rms > span_features.rms_thresholds[span_ids],
+            span_features.zcr < span_features.zcr_thresholds[span_ids],
+            span_features.energy > span_features.energy_thresholds[span_ids],
+        ]
+
+        hops_counts = -(-span_features.segment_lengths // hop_length)
+        _, hop_span_ids, hop_indices = SpanFrameFeatures.expand(hops_counts)
+        hop_starts = hop_indices * hop_length
+        frame_indices = hop_starts // span_features.frame_length
+        in_range = frame_indices < span_features.frames_counts[hop_span_ids]
+        frame_positions = span_features.frame_offsets[hop_span_ids[in_range]] + frame_indices[in_range]
+
+        vowel_mask = in_range.copy()
+        for frame_mask in frame_masks:
+            filtered_mask = self.filter_short_runs_by_span(frame_mask, span_ids, local_indices,
+                                                           span_features.frame_length, sample_rate)
+            vowel_mask[in_range] &= filtered_mask[frame_positions]
+
+        vowels_per_span = [[] for _ in spans]
+        run_starts, run_ends = self.mask_to_runs_by_span(vowel_mask, hop_span_ids)
+        for start, end in zip(run_starts, run_ends):
+            vowels_per_span[hop_span_ids[start]].append(
+                (int(hop_starts[start]) / sample_rate, (int(hop_starts[end - 1]) + hop_length) / sample_rate))
+
+        return vowels_per_span
+
+    def high_rms_frame_mask(self, frame_features):
+        rms = frame_features.rms
+        mask = rms[:frame_features.frames_count] > np.mean(rms)
+
+        return self.filter_short_runs(mask, frame_features.frame_length, frame_features.sample_rate)
+
+    def low_zcr_frame_mask(self, frame_features):
+        zcr = frame_features.zcr
+        mask = zcr[:frame_features.frames_count] < np.mean(zcr)
+
+        return self.filter_short_runs(mask, frame_features.frame_length, frame_features.sample_rate)
+
+    def high_autocorrelation_frame_mask(self, frame_features):
+        energy = frame_features.energy
+        if len(energy) == 0:
+            return np.zeros(0, dtype=bool)
+        mask = energy > np.mean(energy)
+
+        return self.filter_short_runs(mask, frame_features.frame_length, frame_features.sample_rate)
+
+    def periodicity_frame_mask(self, frame_features):
+        periodicity = frame_features.periodicity
+        mask = periodicity > self.VOICING_THRESHOLD
+
+        return self.filter_short_runs(mask, frame_features.frame_length, frame_features.sample_rate)
+
+    def find_vowels_with_loop(self, audio_signal, sample_rate, frame_length=0.001):
         hop_length = int(frame_length * sample_rate)
 
         high_rms_time_ranges = self.find_high_rms(audio_signal, sample_rate)
@@ -91,12 +205,8 @@ class VowelsDetectionService:
 
     @staticmethod
     def calculate_autocorrelation(y, frame_length, hop_length):
-        autocorrelation = []
-        for i in range(0, len(y) - frame_length, hop_length):
-            frame = y[i:i + frame_length]
-            correlation = np.correlate(frame, frame, mode='full')
-            autocorrelation.append(correlation[len(correlation) // 2])
-        return np.array(autocorrelation)
+        frames = FrameFeatures.frame_signal(y, frame_length, hop_length)
+        return AutocorrelationEngine.zero_lag_energy(frames)
 
     @staticmethod
     def indices_to_time_ranges(indices, sample_rate, frame_length):
@@ -136,6 +246,48 @@ class VowelsDetectionService:
 
         return time_ranges
 
+    @staticmethod
+    def mask_to_runs(mask):
+        padded = np.concatenate(([False], mask, [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        return edges[0::2], edges[1::2]
+
+    def filter_short_runs(self, frame_mask, frame_length, sample_rate):
+        run_starts, run_ends = self.mask_to_runs(frame_mask)
+
+        durations = (run_ends * frame_length) / sample_rate - (run_starts * frame_length) / sample_rate
+        long_runs = durations >= 3 * frame_length / sample_rate
+
+        return self.runs_to_mask(len(frame_mask), run_starts[long_runs], run_ends[long_runs])
+
+    @staticmethod
+    def mask_to_runs_by_span(mask, span_ids):
+        same_span = span_ids[1:] == span_ids[:-1]
+
+        continues_previous = np.zeros(len(mask), dtype=bool)
+        continues_previous[1:] = mask[:-1] & same_span
+        continues_next = np.zeros(len(mask), dtype=bool)
+        continues_next[:-1] = mask[1:] & same_span
+
+        return np.flatnonzero(mask & ~continues_previous), np.flatnonzero(mask & ~continues_next) + 1
+
+    def filter_short_runs_by_span(self, frame_mask, span_ids, local_indices, frame_length, sample_rate):
+        run_starts, run_ends = self.mask_to_runs_by_span(frame_mask, span_ids)
+
+        local_starts = local_indices[run_starts]
+        local_ends = local_indices[run_ends - 1] + 1
+        durations = (local_ends * frame_length) / sample_rate - (local_starts * frame_length) / sample_rate
+        long_runs = durations >= 3 * frame_length / sample_rate
+
+        return self.runs_to_mask(len(frame_mask), run_starts[long_runs], run_ends[long_runs])
+
+    @staticmethod
+    def runs_to_mask(length, run_starts, run_ends):
+        boundaries = np.zeros(length + 1, dtype=int)
+        np.add.at(boundaries, run_starts, 1)
+        np.add.at(boundaries, run_ends, -1)
+        return np.cumsum(boundaries[:-1]) > 0
+
     @staticmethod
     def filter_time_ranges(time_ranges, frame_length, sample_rate):
         min_duration = 3 * frame_length / sample_rate
@@ -143,3 +295,121 @@ class VowelsDetectionService:
         filtered_ranges = [time_range for time_range in time_ranges if (time_range[1] - time_range[0]) >= min_duration]
 
         return filtered_ranges
+
+
+class StreamingVowelsDetector:
+    MIN_RUN_FRAMES = 3
+
+    def __init__(self, vowels_service, sample_rate, warmup_frames=50, frame_duration=0.01):
+        self.vowels_service = vowels_service
+        self.sample_rate = sample_rate
+        self.frame_length = int(frame_duration * sample_rate)
+        self.warmup_frames = warmup_frames
+        self.lookahead_frames = self.MIN_RUN_FRAMES - 1
+
+        self.remainder = np.zeros(0, dtype=np.float32)
+        self.feature_sums = np.zeros(3)
+        self.frames_seen = 0
+
+        self.pending_features = np.zeros((0, 3))
+        self.decisions = np.zeros((0, 3), dtype=bool)
+        self.decisions_start = 0
+        self.finalized_frames = 0
+        self.vowel_start_frame = None
+
+    @property
+    def latency(self):
+        return (self.warmup_frames + self.lookahead_frames) * self.frame_length / self.sample_rate
+
+    def push(self, chunk):
+        signal = np.concatenate((self.remainder, np.asarray(chunk, dtype=np.float32)))
+        frames_count = len(signal) // self.frame_length
+        self.remainder = signal[frames_count * self.frame_length:]
+
+        if frames_count > 0:
+            frames = signal[:frames_count * self.frame_length].reshape(frames_count, self.frame_length)
+            self.add_frame_features(self.calculate_frame_features(frames))
+
+        return self.finalize(len(self.decisions) - self.lookahead_frames)
+
+    def flush(self):
+        if len(self.pending_features) > 0:
+            self.decide_pending_frames()
+        return self.finalize(len(self.decisions), end_of_stream=True)
+
+    def calculate_frame_features(self, frames):
+        energy = AutocorrelationEngine.zero_lag_energy(frames)
+        rms = np.sqrt(energy / self.frame_length)
+
+        negative = frames < -FrameFeatures.ZERO_CROSSING_THRESHOLD
+        zcr = np.count_nonzero(negative[:, 1:] != negative[:, :-1], axis=1) / self.frame_length
+
+        return np.column_stack((rms, zcr, energy))
+
+    def add_frame_features(self, features):
+        self.pending_features = np.concatenate((self.pending_features, features))
+
+        if self.frames_seen + len(self.pending_features) >= self.warmup_frames:
+            self.decide_pending_frames()
+
+    def decide_pending_frames(self):
+        features = self.pending_features
+        frame_indices = self.frames_seen + np.arange(len(features))
+
+        running_sums = self.feature_sums + np.cumsum(features, axis=0)
+        thresholds = running_sums / (frame_indices + 1)[:, np.newaxis]
+
+        warmup_index = min(self.warmup_frames, self.frames_seen + len(features)) - 1 - self.frames_seen
+        if warmup_index >= 0:
+            thresholds[:warmup_index] = thresholds[warmup_index]
+
+        decisions = np.column_stack((
+            features[:, 0] > thresholds[:, 0],
+            features[:, 1] < thresholds[:, 1],
+            features[:, 2] > thresholds[:, 2],
+        ))
+
+        self.feature_sums = running_sums[-1]
+        self.frames_seen += len(features)
+        self.decisions = np.concatenate((self.decisions, decisions))
+        self.pending_features = np.zeros((0, 3))
+
+    def finalize(self, decided_limit, end_of_stream=False):
+        first_local = self.finalized_frames - self.decisions_start
+        if decided_limit <= first_local:
+            return []
+
+        filtered = np.column_stack([
+            self.filter_decisions(self.decisions[:, criterion]) for criterion in range(3)
+        ])
+        vowel_mask = filtered[first_local:decided_limit].all(axis=1)
+
+        vowel_ranges = []
+        for offset, is_vowel in enumerate(vowel_mask):
+            frame_index = self.finalized_frames + offset
+            if is_vowel and self.vowel_start_frame is None:
+                self.vowel_start_frame = frame_index
+            elif not is_vowel and self.vowel_start_frame is not None:
+                vowel_ranges.append(self.frames_to_time_range(self.vowel_start_frame, frame_index))
+                self.vowel_start_frame = None
+
+        self.finalized_frames += len(vowel_mask)
+
+        if end_of_stream and self.vowel_start_frame is not None:
+            vowel_ranges.append(self.frames_to_time_range(self.vowel_start_frame, self.finalized_frames))
+            self.vowel_start_frame = None
+
+        history_start = max(self.finalized_frames - self.lookahead_frames, self.decisions_start)
+        self.decisions = self.decisions[history_start - self.decisions_start:]
+        self.decisions_start = history_start
+
+        return vowel_ranges
+
+    def filter_decisions(self, decisions):
+        run_starts, run_ends = self.vowels_service.mask_to_runs(decisions)
+        long_runs = run_ends - run_starts >= self.MIN_RUN_FRAMES
+        return self.vowels_service.runs_to_mask(len(decisions), run_starts[long_runs], run_ends[long_runs])
+
+    def frames_to_time_range(self, start_frame, end_frame):
+        return (start_frame * self.frame_length / self.sample_rate,
+                end_frame * self.frame_length / self.sample_rate)
@@ -13,22 +13,13 @@ class YouTubeDownloader:
         if not os.path.exists(self.folder_path):
             os.makedirs(self.folder_path)
 
-    def download_youtube_audio(self, url, file_name='lector_audio.mp3'):
+    def download_youtube_video(self, url, file_name='lector_video.mp4', output_path=None):
+        output_path = output_path or self.folder_path
         try:
             yt = YouTube(url)
-            video = yt.streams.filter(only_audio=True).first()
-            video.download(output_path=self.folder_path, filename=file_name)
-            return os.path.join(self.folder_path, file_name)
-        except Exception as e:
-            print("download youtube audio error:")
-            print(e)
-            
-    def download_youtube_video(self, url, file_name='lector_video.mp4'):
-        try:
-            yt = YouTube(url)
-            video = yt.streams.first()
-            video.download(output_path=self.folder_path, filename=file_name)
-            return os.path.join(self.folder_path, file_name)
+            video = yt.streams.filter(progressive=True).first() or yt.streams.first()
+            video.download(output_path=output_path, filename=file_name)
+            return os.path.join(output_path, file_name)
         except Exception as e:
             print("download youtube video error:")
             print(e)
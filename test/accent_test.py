@@ -1,6 +1,7 @@
 import os
 
 import librosa
+import numpy as np
 import pytest
 
 from service.accent_analysis_service import AccentAnalysisService
@@ -147,3 +148,35 @@ def test_accent_not_ok(path1, path2, word):
 
     is_accent_ok = accent_service.compare_accents_in_given_word(signal1, sr1, signal2, sr2)
     assert is_accent_ok == False
+
+
+def test_process_mode_matches_thread_mode():
+    from types import SimpleNamespace
+
+    from data.model.output_models.time_range import TimeRange
+
+    def build_utterance(pairs, index):
+        signals = []
+        words = []
+        position = 0
+        sr = None
+        for pair in pairs:
+            signal, sr = librosa.load(pair[index], sr=None)
+            words.append(SimpleNamespace(word=pair[2], start=position / sr, end=(position + len(signal)) / sr))
+            signals.append(signal)
+            position += len(signal)
+        return np.concatenate(signals), sr, words
+
+    pairs = accent_not_ok[:6]
+    results = {}
+    for mode in (AccentAnalysisService.THREAD_MODE, AccentAnalysisService.PROCESS_MODE):
+        accent_service = AccentAnalysisService(execution_mode=mode, max_workers=2, chunk_size=2)
+        lector_audio, lsr, lector_words = build_utterance(pairs, 0)
+        user_audio, usr, user_words = build_utterance(pairs, 1)
+
+        differences = accent_service.compare_accents(lector_audio, lsr, TimeRange(0, len(lector_audio) / lsr),
+                                                     user_audio, usr, lector_words, user_words)
+        accent_service.shutdown()
+        results[mode] = sorted((data.word, data.sampled_audio_lector) for data in differences)
+
+    assert results[AccentAnalysisService.PROCESS_MODE] == results[AccentAnalysisService.THREAD_MODE]
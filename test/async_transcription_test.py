@@ -0,0 +1,56 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from benchmark.deepgram_stub_server import DeepgramStubServer
+from data.model.input_models.transcription_data import JSONResponse
+from data.remote_data_source.async_transcription_remote_data_source import AsyncTranscriptService
+from data.remote_data_source.transcript_cache import TranscriptCache
+
+
+class TestAsyncTranscriptService(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache = TranscriptCache(os.path.join(self.temporary_directory.name, 'cache'))
+        self.filepaths = []
+        for i in range(4):
+            filepath = os.path.join(self.temporary_directory.name, f'audio{i}.wav')
+            sf.write(filepath, np.full((4410, 2), i / 10, dtype=np.float32), 44100)
+            self.filepaths.append(filepath)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def transcribe_twice(self, stub):
+        async def transcribe():
+            async with AsyncTranscriptService('stub-key', stub.url, self.cache, max_connections=4) as service:
+                start = time.perf_counter()
+                transcripts = await service.get_transcripts_data_from_deepgram(self.filepaths)
+                elapsed_time = time.perf_counter() - start
+                cached_transcripts = await service.get_transcripts_data_from_deepgram(self.filepaths)
+            return transcripts, elapsed_time, cached_transcripts
+
+        return asyncio.run(transcribe())
+
+    def test_transcriptions_run_concurrently_over_pooled_connections(self):
+        with DeepgramStubServer(delay=0.3) as stub:
+            transcripts, elapsed_time, cached_transcripts = self.transcribe_twice(stub)
+
+            self.assertLess(elapsed_time, 4 * 0.3)
+            self.assertEqual(4, stub.requests_count)
+            self.assertLessEqual(stub.connections_count, 4)
+
+        for transcript in transcripts + cached_transcripts:
+            self.assertIsInstance(transcript, JSONResponse)
+            self.assertEqual(['hello', 'world'], [word.word for word in transcript.results.channels[0].alternatives[0].words])
+        self.assertEqual(4, self.cache.get_stats()['hits'])
+
+
+if __name__ == '__main__':
+    unittest.main()
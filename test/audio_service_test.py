@@ -0,0 +1,139 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from data.model.output_models.accent_data import AccentData
+from service.audio_service import AudioService
+
+
+class TestChartSampling(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.segment = (rng.standard_normal(44100) * 0.1).astype(np.float32)
+        self.segment[12345] = 0.9
+        self.segment[30000] = -0.8
+
+    def test_envelope_keeps_peaks(self):
+        sampled = AudioService.sample_audio_segment_to_draw_chart(self.segment)
+
+        self.assertEqual(500, len(sampled))
+        self.assertAlmostEqual(0.9, max(sampled), places=6)
+        self.assertAlmostEqual(-0.8, min(sampled), places=6)
+
+    def test_short_segment_is_not_resampled(self):
+        segment = np.array([0.1, -0.2, 0.3], dtype=np.float32)
+
+        sampled = AudioService.sample_audio_segment_to_draw_chart(segment)
+
+        np.testing.assert_allclose(sampled, segment)
+
+    def test_int16_encoding_round_trip(self):
+        encoded = AudioService.sample_audio_segment_to_draw_chart(self.segment, encoding=AudioService.INT16_ENCODING)
+
+        decoded = np.frombuffer(base64.b64decode(encoded), dtype='<i2') / 32767
+        expected = AudioService.min_max_envelope(self.segment, 500)
+        np.testing.assert_allclose(decoded, expected, atol=1 / 32767)
+
+    def test_float16_encoding_round_trip(self):
+        encoded = AudioService.sample_audio_segment_to_draw_chart(self.segment, encoding=AudioService.FLOAT16_ENCODING)
+
+        decoded = np.frombuffer(base64.b64decode(encoded), dtype='<f2')
+        expected = AudioService.min_max_envelope(self.segment, 500)
+        np.testing.assert_allclose(decoded, expected, atol=1e-3)
+
+    def test_encoded_payload_is_smaller(self):
+        plain = AccentData('word', AudioService.sample_audio_segment_to_draw_chart(self.segment),
+                           AudioService.sample_audio_segment_to_draw_chart(self.segment))
+        compact = AccentData('word',
+                             AudioService.sample_audio_segment_to_draw_chart(self.segment, encoding='int16'),
+                             AudioService.sample_audio_segment_to_draw_chart(self.segment, encoding='int16'),
+                             'int16')
+
+        plain_size = len(json.dumps(plain.to_dict()))
+        compact_size = len(json.dumps(compact.to_dict()))
+        self.assertLess(compact_size * 4, plain_size)
+
+
+class TestAnalysisAudio(unittest.TestCase):
+
+    def test_stereo_upload_is_loaded_as_mono_at_analysis_rate(self):
+        t = np.arange(44100) / 44100
+        tone = 0.5 * np.sin(2 * np.pi * 220 * t)
+        stereo = np.stack([tone, tone], axis=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stereo.wav')
+            sf.write(path, stereo, 44100)
+            audio, sr = AudioService.load_analysis_audio(path)
+
+        self.assertEqual(AudioService.ANALYSIS_SAMPLE_RATE, sr)
+        self.assertEqual(1, audio.ndim)
+        self.assertEqual(AudioService.ANALYSIS_SAMPLE_RATE, len(audio))
+
+
+class TestAudioSegment(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, 'lector_audio.wav')
+        t = np.arange(10 * 44100) / 44100
+        tone = 0.5 * np.sin(2 * np.pi * (220 + 20 * t) * t)
+        sf.write(self.path, np.stack([tone, 0.5 * tone], axis=1), 44100)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_segment_matches_slice_of_fully_loaded_audio(self):
+        for sample_rate in [None, 16000]:
+            full_audio, full_sr = librosa.load(self.path, sr=sample_rate)
+            for start, end in [(0.0, 2.5), (3.217, 5.9), (8.5, 12.0)]:
+                segment, sr = AudioService.load_audio_segment(self.path, start, end, sample_rate)
+                expected = full_audio[int(start * full_sr):int(end * full_sr)]
+
+                self.assertEqual(full_sr, sr)
+                self.assertEqual(len(expected), len(segment))
+                self.assertLess(np.max(np.abs(segment - expected)), 1e-4)
+
+    def test_segment_after_end_of_file_is_empty(self):
+        segment, sr = AudioService.load_audio_segment(self.path, 11.0, 12.0, 16000)
+
+        self.assertEqual(16000, sr)
+        self.assertEqual(0, len(segment))
+
+
+class TestTranscriptionEncoding(unittest.TestCase):
+
+    def test_stereo_recording_is_encoded_as_compact_mono_flac(self):
+        t = np.arange(2 * 44100) / 44100
+        tone = 0.5 * np.sin(2 * np.pi * 220 * t)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stereo.wav')
+            sf.write(path, np.stack([tone, tone], axis=1), 44100)
+            encoded_path = AudioService.encode_for_transcription(path, os.path.join(directory, 'upload.flac'),
+                                                                 block_size=4096)
+
+            encoded, sr = sf.read(encoded_path)
+            info = sf.info(encoded_path)
+            self.assertLess(os.path.getsize(encoded_path) * 4, os.path.getsize(path))
+
+        expected = 0.5 * np.sin(2 * np.pi * 220 * np.arange(len(encoded)) / sr)
+        self.assertEqual(('FLAC', 1), (info.format, info.channels))
+        self.assertEqual(AudioService.ANALYSIS_SAMPLE_RATE, sr)
+        self.assertEqual(2 * sr, len(encoded))
+        self.assertLess(np.max(np.abs(encoded[100:-100] - expected[100:-100])), 0.01)
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            AudioService.encode_for_transcription('input.wav', 'output.mp3', 'mp3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from service.autocorrelation_engine import AutocorrelationEngine
+from service.frame_features import FrameFeatures
+from service.vowels_detection_service import VowelsDetectionService
+
+
+class TestAutocorrelationEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frames = rng.standard_normal((20, 160))
+
+    def test_zero_lag_energy(self):
+        expected = [np.correlate(frame, frame, mode='full')[len(frame) - 1] for frame in self.frames]
+        np.testing.assert_allclose(AutocorrelationEngine.zero_lag_energy(self.frames), expected)
+
+    def test_fft_autocorrelation_matches_correlate(self):
+        expected = np.array([np.correlate(frame, frame, mode='full')[len(frame) - 1:] for frame in self.frames])
+        np.testing.assert_allclose(AutocorrelationEngine.autocorrelation(self.frames), expected, atol=1e-9)
+
+    def test_periodic_frames_have_high_periodicity(self):
+        sample_rate = 16000
+        window_length = AutocorrelationEngine.periodicity_window_length(sample_rate)
+        times = np.arange(window_length) / sample_rate
+        voiced = np.sin(2 * np.pi * 200 * times)[np.newaxis, :]
+        noise = np.random.default_rng(0).standard_normal((20, window_length))
+
+        self.assertGreater(AutocorrelationEngine.periodicity(voiced, sample_rate)[0], 0.95)
+        self.assertLess(AutocorrelationEngine.periodicity(noise, sample_rate).max(), 0.4)
+
+    def test_low_pitched_tones_pass_voicing_threshold(self):
+        for sample_rate in [16000, 44100]:
+            times = np.arange(sample_rate) / sample_rate
+            for frequency in [110, 120, 150]:
+                tone = 0.5 * np.sin(2 * np.pi * frequency * times)
+
+                periodicity = FrameFeatures(tone, sample_rate).periodicity
+
+                self.assertGreater(periodicity[5:-5].min(), VowelsDetectionService.VOICING_THRESHOLD)
+
+    def test_silent_frames(self):
+        silent = np.zeros((3, 160))
+
+        np.testing.assert_array_equal(AutocorrelationEngine.periodicity(silent, 16000), np.zeros(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
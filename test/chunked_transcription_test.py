@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from deepgram import DeepgramClient, DeepgramClientOptions
+
+from benchmark.deepgram_stub_server import DeepgramStubServer, create_tone_response, create_tone_speech
+from data.model.input_models.transcription_data import Word
+from data.remote_data_source.request_runner import RequestRunner
+from data.remote_data_source.transcript_cache import TranscriptCache
+from data.remote_data_source.transcription_remote_data_source import TranscriptService
+from service.chunked_transcription_service import ChunkedTranscriptionService
+from service.compute_executor import ComputeExecutor
+
+
+class TestChunkedTranscription(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.executor = ComputeExecutor(cpu_workers=1, io_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.temporary_directory.cleanup()
+
+    def create_chunked_service(self, stub, chunk_duration):
+        transcript_service = TranscriptService(
+            TranscriptCache(os.path.join(self.temporary_directory.name, 'cache')),
+            deepgram_client=DeepgramClient('stub-key', DeepgramClientOptions(url=stub.url)))
+        return ChunkedTranscriptionService(transcript_service, self.executor, chunk_duration=chunk_duration,
+                                           overlap_duration=2.0, silence_search_duration=5.0)
+
+    def test_chunked_words_match_single_request(self):
+        audio = create_tone_speech(120)
+        audio_filepath = os.path.join(self.temporary_directory.name, 'lector.wav')
+        ChunkedTranscriptionService.write_chunk(audio_filepath, audio, 16000)
+
+        with DeepgramStubServer(response_factory=create_tone_response) as stub:
+            single_words = self.create_chunked_service(stub, 1000).get_words(audio_filepath, audio, 16000)
+            chunked_service = self.create_chunked_service(stub, 20)
+            chunked_words = chunked_service.get_words(audio_filepath, audio, 16000)
+            self.assertGreater(stub.requests_count, 4)
+
+        self.assertEqual(120, len(single_words))
+        self.assertEqual([word.word for word in single_words], [word.word for word in chunked_words])
+        np.testing.assert_allclose([word.start for word in single_words], [word.start for word in chunked_words],
+                                   atol=0.02)
+
+    def test_lector_transcription_limits_scale_with_audio_length(self):
+        audio = create_tone_speech(120)
+        audio_filepath = os.path.join(self.temporary_directory.name, 'lector.wav')
+        ChunkedTranscriptionService.write_chunk(audio_filepath, audio, 16000)
+
+        with DeepgramStubServer(response_factory=create_tone_response, realtime_factor=0.005) as stub:
+            transcript_service = TranscriptService(
+                TranscriptCache(os.path.join(self.temporary_directory.name, 'cache')),
+                deepgram_client=DeepgramClient('stub-key', DeepgramClientOptions(url=stub.url)),
+                request_runner=RequestRunner(deadline=0.3, max_retries=0),
+                lector_request_runner=RequestRunner(deadline=0.3, max_retries=0))
+
+            with self.assertRaises(TimeoutError):
+                transcript_service.get_transcript_data_from_deepgram(audio_filepath)
+            lector_transcript = transcript_service.get_lector_transcript_data_from_deepgram(audio_filepath)
+
+        self.assertEqual(120, len(lector_transcript.results.channels[0].alternatives[0].words))
+
+    def test_chunk_boundaries_fall_into_silence(self):
+        audio = create_tone_speech(120)
+        boundaries = ChunkedTranscriptionService(None, self.executor, chunk_duration=20,
+                                                 silence_search_duration=5.0).find_chunk_boundaries(audio, 16000)
+
+        self.assertEqual(0.0, boundaries[0])
+        self.assertAlmostEqual(len(audio) / 16000, boundaries[-1])
+        for boundary in boundaries[1:-1]:
+            self.assertEqual(0.0, np.max(np.abs(audio[int((boundary - 0.1) * 16000):int((boundary + 0.1) * 16000)])))
+
+    def test_overlap_words_are_kept_once(self):
+        first_chunk = [Word('a', 1.0, 1.5, 1, 'A', 0, 1), Word('b', 9.0, 9.5, 1, 'B', 0, 1),
+                       Word('c', 10.8, 11.4, 1, 'C', 0, 1)]
+        second_chunk = [Word('b', 0.0, 0.5, 1, 'B', 0, 1), Word('c', 1.8, 2.4, 1, 'C', 0, 1),
+                        Word('d', 4.0, 4.5, 1, 'D', 0, 1)]
+
+        words = ChunkedTranscriptionService.stitch_words([first_chunk, second_chunk], [0.0, 9.0], [0.0, 10.0, 15.0])
+
+        self.assertEqual(['a', 'b', 'c', 'd'], [word.word for word in words])
+        self.assertEqual([1.0, 9.0, 10.8, 13.0], [word.start for word in words])
+        self.assertEqual(0.0, second_chunk[0].start)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import threading
+import unittest
+
+import numpy as np
+
+from service.compute_executor import ComputeExecutor
+from service.intonation_analysis_service import IntonationAnalysisService
+
+
+class TestComputeExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ComputeExecutor(cpu_workers=2, io_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_cpu_work_uses_bounded_worker_threads(self):
+        thread_names = set()
+        lock = threading.Lock()
+
+        def remember_thread():
+            with lock:
+                thread_names.add(threading.current_thread().name)
+
+        futures = [self.executor.submit_cpu(remember_thread) for _ in range(50)]
+        for future in futures:
+            future.result()
+
+        self.assertLessEqual(len(thread_names), 2)
+
+    def test_nested_cpu_work_does_not_deadlock(self):
+        def outer(value):
+            return self.executor.submit_cpu(lambda: value * 2).result(timeout=5)
+
+        futures = [self.executor.submit_cpu(outer, value) for value in range(8)]
+
+        self.assertEqual([value * 2 for value in range(8)], [future.result(timeout=5) for future in futures])
+
+    def test_exceptions_are_reported_through_futures(self):
+        def fail():
+            raise RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            self.executor.submit_cpu(fail).result()
+
+    def test_concurrent_intonation_requests_keep_their_own_results(self):
+        sr = 16000
+        t = np.arange(sr) / sr
+        rising = (0.5 * np.sin(2 * np.pi * (150 + 50 * t) * t)).astype(np.float32)
+        falling = (0.5 * np.sin(2 * np.pi * (250 - 50 * t) * t)).astype(np.float32)
+        pairs = [(rising, rising), (rising, falling), (falling, rising), (falling, falling)] * 2
+
+        intonation_service = IntonationAnalysisService(pitch_backend=IntonationAnalysisService.YIN_BACKEND,
+                                                       executor=self.executor)
+        expected = [intonation_service.get_intonation_success_rate(a, sr, b, sr) for a, b in pairs]
+
+        request_executor = ComputeExecutor(cpu_workers=1, io_workers=len(pairs))
+        try:
+            futures = [request_executor.submit_io(intonation_service.get_intonation_success_rate, a, sr, b, sr)
+                       for a, b in pairs]
+            results = [future.result() for future in futures]
+        finally:
+            request_executor.shutdown()
+
+        self.assertEqual(expected, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import numpy as np
+from scipy.interpolate import interp1d
+
+from service.formant_table import FormantTable
+
+
+def interpolate_reference(values, target_length):
+    if len(values) == target_length:
+        return np.asarray(values)
+    original_times = np.linspace(0, len(values) - 1, num=len(values))
+    target_times = np.linspace(0, len(values) - 1, num=target_length)
+    return interp1d(original_times, values, kind='linear')(target_times)
+
+
+def random_table(rng, lengths):
+    offsets = FormantTable.ragged_offsets(np.array(lengths))
+    return FormantTable(np.arange(offsets[-1]) * 0.01, rng.normal(500, 80, offsets[-1]),
+                        rng.normal(1500, 200, offsets[-1]), offsets)
+
+
+def test_formants_are_sampled_from_track_at_span_times():
+    times = np.arange(0, 1, 0.01)
+    f1 = 500 + 100 * times
+    f2 = 1500 + 200 * times
+    f1[50] = np.nan
+
+    table = FormantTable.from_track((times, f1, f2), [(0.405, 0.605), (0.705, 0.752), (2.0, 2.1)], 0.01)
+
+    vowel_times, vowel_f1, vowel_f2 = table.vowel(0)
+    assert list(table.lengths) == [18, 5, 0]
+    assert vowel_times.min() >= 0.405 and vowel_times.max() < 0.605
+    np.testing.assert_allclose(vowel_f1, 500 + 100 * vowel_times)
+    np.testing.assert_allclose(vowel_f2, 1500 + 200 * vowel_times)
+
+
+def test_pair_correlations_match_per_vowel_computation():
+    rng = np.random.default_rng(0)
+    table1 = random_table(rng, [5, 12, 0, 7, 3, 9])
+    table2 = random_table(rng, [8, 12, 4, 2, 0, 15])
+
+    f1_correlations, f2_correlations = FormantTable.pair_correlations(table1, table2)
+
+    for index in range(table1.vowels_count):
+        _, first_f1, first_f2 = table1.vowel(index)
+        _, second_f1, second_f2 = table2.vowel(index)
+        if len(first_f1) == 0 or len(second_f1) == 0:
+            assert np.isnan(f1_correlations[index]) and np.isnan(f2_correlations[index])
+            continue
+
+        target_length = max(len(first_f1), len(second_f1))
+        expected_f1 = np.corrcoef(interpolate_reference(first_f1, target_length),
+                                  interpolate_reference(second_f1, target_length))[0, 1]
+        expected_f2 = np.corrcoef(interpolate_reference(first_f2, target_length),
+                                  interpolate_reference(second_f2, target_length))[0, 1]
+        assert np.isclose(f1_correlations[index], expected_f1)
+        assert np.isclose(f2_correlations[index], expected_f2)
+
+
+def test_lobanov_normalization_uses_whole_utterance():
+    table = random_table(np.random.default_rng(1), [4, 6, 10]).lobanov_normalized()
+
+    assert np.isclose(np.mean(table.f1), 0) and np.isclose(np.std(table.f1), 1)
+    assert np.isclose(np.mean(table.f2), 0) and np.isclose(np.std(table.f2), 1)
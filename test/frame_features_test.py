@@ -0,0 +1,44 @@
+import os
+
+import librosa
+import numpy as np
+import pytest
+
+from service.frame_features import FrameFeatures
+from service.vowels_detection_service import VowelsDetectionService
+
+base_dir = os.path.dirname(__file__)
+
+paths = [os.path.join(base_dir, 'vowels_audio_test_data', f'test{i}.wav') for i in range(1, 51)]
+
+
+@pytest.mark.parametrize("path", paths)
+def test_features_match_librosa(path):
+    signal, sr = librosa.load(path, sr=None)
+    frame_length = int(0.01 * sr)
+
+    frame_features = FrameFeatures(signal, sr)
+
+    rms = librosa.feature.rms(y=signal, frame_length=frame_length, hop_length=frame_length)[0]
+    zcr = librosa.feature.zero_crossing_rate(y=signal, frame_length=frame_length, hop_length=frame_length)[0]
+    autocorrelation = VowelsDetectionService.calculate_autocorrelation(signal, frame_length, frame_length)
+
+    assert np.array_equal(frame_features.rms, rms)
+    assert np.array_equal(frame_features.zcr, zcr)
+    assert np.allclose(frame_features.energy, autocorrelation, rtol=1e-4)
+
+
+def test_frames_are_a_view():
+    signal = np.arange(1000, dtype=np.float32)
+
+    frame_features = FrameFeatures(signal, 1000)
+
+    assert np.shares_memory(frame_features.frames, signal)
+    assert frame_features.frames.shape == (99, 10)
+
+
+def test_signal_shorter_than_frame():
+    frame_features = FrameFeatures(np.zeros(5, dtype=np.float32), 1000)
+
+    assert frame_features.frames_count == 0
+    assert len(frame_features.energy) == 0
@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+
+from service.compute_executor import ComputeExecutor
+from service.ingest_pipeline import IngestPipeline
+
+
+class TestIngestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ComputeExecutor(cpu_workers=2, io_workers=2)
+        self.pipeline = IngestPipeline(self.executor)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_dependency_results_are_passed_to_stages(self):
+        self.pipeline.add_stage('video', lambda: 'video.mp4')
+        self.pipeline.add_stage('wav', lambda video: video.replace('.mp4', '.wav'), dependencies=['video'])
+        self.pipeline.add_stage('pauses', lambda video, wav: [video, wav], dependencies=['video', 'wav'],
+                                kind=IngestPipeline.CPU_STAGE)
+
+        results = self.pipeline.run()
+
+        self.assertEqual(['video.mp4', 'video.wav'], results['pauses'])
+
+    def test_independent_stages_run_in_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+        self.pipeline.add_stage('wav', lambda: None)
+        for name in ['transcription', 'analysis_audio', 'pitch']:
+            self.pipeline.add_stage(name, lambda _: barrier.wait(), dependencies=['wav'],
+                                    kind=IngestPipeline.CPU_STAGE if name == 'pitch' else IngestPipeline.IO_STAGE)
+
+        self.pipeline.run()
+
+        timings = self.pipeline.get_timings()
+        self.assertEqual({'wav', 'transcription', 'analysis_audio', 'pitch'}, set(timings))
+        self.assertTrue(all(timings[name]['start'] >= timings['wav']['start'] for name in timings))
+
+    def test_failure_stops_dependent_stages_and_is_raised(self):
+        calls = []
+
+        def fail():
+            time.sleep(0.05)
+            raise RuntimeError("download failed")
+
+        self.pipeline.add_stage('video', fail)
+        self.pipeline.add_stage('slow', lambda: time.sleep(0.1) or calls.append('slow'))
+        self.pipeline.add_stage('wav', lambda _: calls.append('wav'), dependencies=['video'])
+
+        with self.assertRaises(RuntimeError):
+            self.pipeline.run()
+
+        self.assertEqual(['slow'], calls)
+        self.assertEqual({'video', 'slow'}, set(self.pipeline.get_timings()))
+
+    def test_pauses_are_ready_before_background_pitch_finishes(self):
+        pitch_released = threading.Event()
+        self.pipeline.add_stage('analysis_audio', lambda: 'analysis audio', kind=IngestPipeline.CPU_STAGE)
+        self.pipeline.add_stage('pitch', lambda _: pitch_released.wait(5) and 'pitch track',
+                                dependencies=['analysis_audio'], kind=IngestPipeline.CPU_STAGE, background=True)
+        self.pipeline.add_stage('pauses', lambda _: 'pauses', dependencies=['analysis_audio'])
+
+        results = self.pipeline.run()
+        pitch_future = self.pipeline.background_futures['pitch']
+
+        self.assertEqual('pauses', results['pauses'])
+        self.assertNotIn('pitch', results)
+        self.assertFalse(pitch_future.done())
+
+        pitch_released.set()
+        self.assertEqual('pitch track', pitch_future.result(timeout=5))
+        self.assertIn('pitch', self.pipeline.get_timings())
+
+    def test_invalid_stages_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.pipeline.add_stage('wav', lambda video: None, dependencies=['video'])
+        with self.assertRaises(ValueError):
+            self.pipeline.add_stage('video', lambda: None, kind='gpu')
+
+        self.pipeline.add_stage('pitch', lambda: None, background=True)
+        with self.assertRaises(ValueError):
+            self.pipeline.add_stage('intonation', lambda pitch: None, dependencies=['pitch'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import os
 
 import librosa
+import numpy as np
 import pytest
 
+from service.dtw_aligner import DtwAligner
 from service.intonation_analysis_service import IntonationAnalysisService
 from utils.plot_helper import plot_pitch_lector_user
 
@@ -41,7 +43,7 @@ def test_high_similarity(path1, path2):
 
     signal1, sr1 = librosa.load(path1, sr=None)
     signal2, sr2 = librosa.load(path2, sr=None)
-    pitch1, pitch2, similarity = intonation_service.get_intonation_success_rate(signal1, signal2)
+    pitch1, pitch2, similarity = intonation_service.get_intonation_success_rate(signal1, sr1, signal2, sr2)
 
     plot_pitch_lector_user(pitch1, pitch2, f'oczekiwana wysoka zbieżność, uzyskana zbieżność: {similarity * 100}%')
 
@@ -54,6 +56,52 @@ def test_low_similarity(path1, path2):
 
     signal1, sr1 = librosa.load(path1, sr=None)
     signal2, sr2 = librosa.load(path2, sr=None)
-    _, _, similarity = intonation_service.get_intonation_success_rate(signal1, signal2)
+    _, _, similarity = intonation_service.get_intonation_success_rate(signal1, sr1, signal2, sr2)
 
     assert similarity <= 0.7
+
+
+def test_slice_pitch_track_skips_unvoiced_frames():
+    times = np.arange(10) * 0.1
+    f0 = np.array([100, np.nan, 110, 120, np.nan, 130, 140, 150, np.nan, 160], dtype=np.float32)
+
+    pitch = IntonationAnalysisService.slice_pitch_track(times, f0, 0.2, 0.7)
+
+    np.testing.assert_array_equal(pitch, [110, 120, 130, 140])
+
+
+@pytest.mark.parametrize("backend", list(IntonationAnalysisService.PITCH_BACKENDS))
+def test_pitch_backend_tracks_steady_tone(backend):
+    sr = 16000
+    t = np.arange(sr) / sr
+    tone = (0.5 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+
+    times, f0 = IntonationAnalysisService(pitch_backend=backend).get_pitch_track_with_times(tone, sr)
+
+    assert len(times) == len(f0)
+    assert abs(np.nanmedian(f0) - 200) < 5
+
+
+@pytest.mark.parametrize("backend", [IntonationAnalysisService.PYIN_BACKEND, IntonationAnalysisService.YIN_BACKEND])
+def test_windowed_pitch_track_matches_whole_signal_track(backend):
+    sr = 16000
+    t = np.arange(3 * sr) / sr
+    tone = (0.5 * np.sin(2 * np.pi * (150 * t + 20 * t ** 2))).astype(np.float32)
+    pitch_backend = IntonationAnalysisService.PITCH_BACKENDS[backend]()
+
+    times, f0 = pitch_backend.get_pitch_track(tone, sr)
+    windowed_times, windowed_f0 = pitch_backend.get_windowed_pitch_track(tone, sr, window_duration=0.5)
+
+    np.testing.assert_allclose(windowed_times, times)
+    np.testing.assert_allclose(windowed_f0, f0)
+
+
+def test_dtw_alignment_undoes_tempo_changes():
+    t = np.linspace(0, 1, 200)
+    lector_contour = 200 + 30 * np.sin(2 * np.pi * 2 * t)
+    user_contour = 200 + 30 * np.sin(2 * np.pi * 2 * t[:150] ** 1.5 / t[149] ** 1.5)
+
+    aligned_lector, aligned_user = DtwAligner.align(lector_contour, user_contour)
+
+    assert len(aligned_lector) == len(aligned_user)
+    assert np.corrcoef(aligned_lector, aligned_user)[0, 1] > 0.99
@@ -0,0 +1,57 @@
+import threading
+import unittest
+
+from service.compute_executor import ComputeExecutor
+from service.job_registry import JobRegistry
+
+
+class TestJobRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ComputeExecutor(cpu_workers=1, io_workers=1)
+        self.job_registry = JobRegistry(self.executor, max_jobs=3)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_pending_job_reports_result_when_done(self):
+        release = threading.Event()
+
+        def job():
+            release.wait(5)
+            return 0.75
+
+        job_id = self.job_registry.submit(job)
+        self.assertEqual((JobRegistry.PENDING, None), self.job_registry.get_status(job_id))
+
+        release.set()
+        self.job_registry.jobs[job_id].result(timeout=5)
+        self.assertEqual((JobRegistry.DONE, 0.75), self.job_registry.get_status(job_id))
+
+    def test_failed_job_is_reported(self):
+        def job():
+            raise RuntimeError("failed")
+
+        job_id = self.job_registry.submit(job)
+        self.job_registry.jobs[job_id].exception(timeout=5)
+
+        self.assertEqual((JobRegistry.FAILED, None), self.job_registry.get_status(job_id))
+
+    def test_unknown_job(self):
+        self.assertEqual((None, None), self.job_registry.get_status('missing'))
+
+    def test_finished_jobs_are_evicted_above_limit(self):
+        job_ids = [self.job_registry.submit(lambda value=value: value) for value in range(3)]
+        for job_id in job_ids:
+            self.job_registry.jobs[job_id].result(timeout=5)
+
+        latest_job_id = self.job_registry.submit(lambda: 3)
+
+        self.assertEqual(3, len(self.job_registry.jobs))
+        self.assertEqual((None, None), self.job_registry.get_status(job_ids[0]))
+        self.job_registry.jobs[latest_job_id].result(timeout=5)
+        self.assertEqual((JobRegistry.DONE, 3), self.job_registry.get_status(latest_job_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
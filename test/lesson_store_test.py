@@ -0,0 +1,87 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from service.lesson_store import LessonStore
+
+
+class TestLessonStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.lesson_store = LessonStore(self.temporary_directory.name)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_video_id_is_taken_from_youtube_urls(self):
+        for url in ['https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42', 'https://youtu.be/dQw4w9WgXcQ',
+                    'https://www.youtube.com/embed/dQw4w9WgXcQ']:
+            self.assertEqual('dQw4w9WgXcQ', LessonStore.get_video_id(url))
+
+    def test_concurrent_first_requests_coalesce_into_one_ingest(self):
+        ingests = []
+        release = threading.Event()
+
+        def ingest(lesson_files):
+            ingests.append(lesson_files.directory)
+            release.wait(5)
+            with open(lesson_files.pauses_file_path, 'w') as file:
+                file.write('[1000.0]')
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(self.lesson_store.ensure, 'lesson', LessonStore.AUDIO_ARTIFACT, ingest)
+                       for _ in range(4)]
+            while self.lesson_store.get_stats()['coalesced'] < 3:
+                time.sleep(0.01)
+            release.set()
+            directories = {future.result(timeout=5).directory for future in futures}
+
+        self.lesson_store.ensure('lesson', LessonStore.AUDIO_ARTIFACT, ingest)
+
+        self.assertEqual(1, len(ingests))
+        self.assertEqual({ingests[0]}, directories)
+        self.assertEqual({'hits': 1, 'ingests': 1, 'coalesced': 3, 'failures': 0}, self.lesson_store.get_stats())
+
+    def test_failed_ingest_is_retried_by_next_request(self):
+        def failing_ingest(lesson_files):
+            raise RuntimeError("download failed")
+
+        with self.assertRaises(RuntimeError):
+            self.lesson_store.ensure('lesson', LessonStore.VIDEO_ARTIFACT, failing_ingest)
+
+        ingests = []
+        self.lesson_store.ensure('lesson', LessonStore.VIDEO_ARTIFACT, ingests.append)
+        self.assertEqual(1, len(ingests))
+        self.assertTrue(self.lesson_store.is_ingested('lesson', LessonStore.VIDEO_ARTIFACT))
+
+    def test_started_ingest_clears_stale_partial_download(self):
+        lesson_files = self.lesson_store.get_lesson_files('lesson')
+        partial_file_path = lesson_files.partial_file_path(LessonStore.VIDEO_ARTIFACT)
+        with open(partial_file_path, 'wb') as file:
+            file.write(b'stale bytes')
+
+        pending = []
+        _, future = self.lesson_store.start('lesson', LessonStore.VIDEO_ARTIFACT, lambda files: None,
+                                            lambda *args: pending.append(args))
+
+        self.assertFalse(os.path.exists(partial_file_path))
+        self.assertFalse(future.done())
+        self.lesson_store.run_ingest(*pending[0][1:])
+        self.assertEqual(lesson_files.directory, future.result(timeout=5).directory)
+
+    def test_ingested_lessons_survive_restart(self):
+        self.lesson_store.ensure('lesson', LessonStore.VIDEO_ARTIFACT, lambda lesson_files: None)
+
+        lesson_store = LessonStore(self.temporary_directory.name)
+        lesson_files = lesson_store.ensure('lesson', LessonStore.VIDEO_ARTIFACT, self.fail)
+
+        self.assertEqual(os.path.join(self.temporary_directory.name, 'lesson'), lesson_files.directory)
+        self.assertEqual(1, lesson_store.get_stats()['hits'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+from service.media_stream import GrowingFileStream
+
+
+class TestGrowingFileStream(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.temporary_directory.name, 'lector_video.mp4')
+        self.download_future = Future()
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def download(self, chunks):
+        with open(self.filepath, 'wb') as file:
+            for chunk in chunks:
+                file.write(chunk)
+                file.flush()
+                time.sleep(0.02)
+        self.download_future.set_result(None)
+
+    def test_stream_follows_file_until_download_finishes(self):
+        chunks = [os.urandom(1000) for _ in range(10)]
+        stream = GrowingFileStream(self.filepath, self.download_future, chunk_size=256, poll_interval=0.005)
+        downloader = threading.Thread(target=self.download, args=(chunks,))
+        downloader.start()
+
+        self.assertTrue(stream.open())
+        streamed = b''.join(stream)
+        downloader.join()
+
+        self.assertEqual(b''.join(chunks), streamed)
+
+    def test_missing_file_after_failed_download_is_reported(self):
+        self.download_future.set_exception(RuntimeError("download failed"))
+        stream = GrowingFileStream(self.filepath, self.download_future)
+
+        self.assertFalse(stream.open())
+
+    def test_truncated_file_aborts_stream(self):
+        with open(self.filepath, 'wb') as file:
+            file.write(os.urandom(1000))
+        stream = GrowingFileStream(self.filepath, self.download_future, poll_interval=0.005)
+        chunks = iter(stream)
+        next(chunks)
+
+        with open(self.filepath, 'wb') as file:
+            file.write(os.urandom(10))
+
+        with self.assertRaises(IOError):
+            next(chunks)
+        self.assertIsNone(stream.file)
+
+    def test_failed_download_aborts_stream(self):
+        with open(self.filepath, 'wb') as file:
+            file.write(os.urandom(1000))
+        stream = GrowingFileStream(self.filepath, self.download_future, chunk_size=256, poll_interval=0.005)
+        chunks = iter(stream)
+        next(chunks)
+
+        self.download_future.set_exception(RuntimeError("download failed"))
+
+        with self.assertRaises(IOError):
+            b''.join(chunks)
+        self.assertIsNone(stream.file)
+
+
+if __name__ == '__main__':
+    unittest.main()
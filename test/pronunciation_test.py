@@ -0,0 +1,52 @@
+import os
+
+import librosa
+import numpy as np
+
+from data.model.input_models.transcription_data import Word
+from data.model.output_models.time_range import TimeRange
+from service.pronunciation_analysis_service import PronunciationAnalysisService
+
+base_dir = os.path.dirname(__file__)
+
+
+def build_utterance(suffix, indices, sr=16000):
+    parts = []
+    words = []
+    time = 0.0
+    for i in indices:
+        signal, _ = librosa.load(os.path.join(base_dir, f'accent_audio_test_data/test{i}{suffix}.wav'), sr=sr)
+        parts.extend([signal, np.zeros(int(0.2 * sr), dtype=np.float32)])
+        words.append(Word(f'word{i}', time, time + len(signal) / sr, 1.0, f'word{i}', 0, 1.0))
+        time += len(signal) / sr + 0.2
+    return np.concatenate(parts), words
+
+
+def score_pronunciation(user_audio, user_words, lector_audio, lector_words):
+    _, accuracy = PronunciationAnalysisService().compare_vowels_pronunciation(
+        user_audio, 16000, lector_audio, 16000, TimeRange(0, len(lector_audio) / 16000), user_words, lector_words)
+    return accuracy
+
+
+def test_identical_pronunciation_scores_full_accuracy():
+    lector_audio, lector_words = build_utterance('a', range(2, 7))
+    user_audio, user_words = build_utterance('a', range(2, 7))
+    lector_starts = [word.start for word in lector_words]
+
+    accuracy = score_pronunciation(user_audio, user_words, lector_audio, lector_words)
+
+    assert accuracy == 1.0
+    assert [word.start for word in lector_words] == lector_starts
+
+
+def test_different_pronunciation_scores_lower():
+    lector_audio, lector_words = build_utterance('a', range(2, 7))
+    user_audio, user_words = build_utterance('a', range(12, 17))
+    for user_word, lector_word in zip(user_words, lector_words):
+        user_word.word = lector_word.word
+        user_word.punctuated_word = lector_word.punctuated_word
+
+    identical_accuracy = score_pronunciation(*build_utterance('a', range(2, 7)), lector_audio, lector_words)
+    different_accuracy = score_pronunciation(user_audio, user_words, lector_audio, lector_words)
+
+    assert different_accuracy < identical_accuracy
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+
+import httpx
+from deepgram import DeepgramApiError
+
+from data.remote_data_source.request_runner import RequestRunner
+
+
+class TestRequestRunner(unittest.TestCase):
+
+    def tearDown(self):
+        self.request_runner.shutdown()
+
+    def test_failed_attempts_are_retried(self):
+        self.request_runner = RequestRunner(deadline=5, max_retries=2, backoff_base=0.01)
+        attempts = []
+
+        def request(timeout):
+            attempts.append(timeout)
+            if len(attempts) < 3:
+                raise ConnectionError("unavailable")
+            return 'transcript'
+
+        self.assertEqual('transcript', self.request_runner.run(request))
+        stats = self.request_runner.get_stats()
+        self.assertEqual((1, 2, 2), (stats['successes'], stats['retries'], stats['attempt_errors']))
+        self.assertTrue(all(0 < timeout <= 5 for timeout in attempts))
+
+    def test_last_error_is_raised_when_retries_run_out(self):
+        self.request_runner = RequestRunner(deadline=5, max_retries=1, backoff_base=0.01)
+
+        def request(timeout):
+            raise ConnectionError("unavailable")
+
+        with self.assertRaises(ConnectionError):
+            self.request_runner.run(request)
+        self.assertEqual(1, self.request_runner.get_stats()['failures'])
+
+    def test_client_errors_are_raised_without_retry(self):
+        self.request_runner = RequestRunner(deadline=5, max_retries=2, backoff_base=0.01)
+        attempts = []
+
+        def request(timeout):
+            attempts.append(timeout)
+            raise DeepgramApiError("Invalid credentials", '401')
+
+        with self.assertRaises(DeepgramApiError):
+            self.request_runner.run(request)
+        self.assertEqual(1, len(attempts))
+        self.assertEqual((0, 1), (self.request_runner.get_stats()['retries'],
+                                  self.request_runner.get_stats()['failures']))
+
+    def test_only_transient_errors_are_retryable(self):
+        self.request_runner = RequestRunner()
+        response = httpx.Response(503, request=httpx.Request('POST', 'https://api.deepgram.com/v1/listen'))
+
+        for exception in [ConnectionError(), httpx.ReadTimeout('slow'), DeepgramApiError('busy', '429'),
+                          DeepgramApiError('unavailable', '503'), httpx.HTTPStatusError('', request=response.request,
+                                                                                         response=response)]:
+            self.assertTrue(RequestRunner.is_retryable(exception), exception)
+        for exception in [DeepgramApiError('bad request', '400'), DeepgramApiError('too large', '413'),
+                          ValueError('bad options')]:
+            self.assertFalse(RequestRunner.is_retryable(exception), exception)
+
+    def test_slow_request_stops_at_deadline(self):
+        self.request_runner = RequestRunner(deadline=0.2, max_retries=2)
+        release = threading.Event()
+
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            self.request_runner.run(lambda timeout: release.wait(5))
+        release.set()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(1, self.request_runner.get_stats()['deadline_exceeded'])
+
+    def test_per_call_limits_override_runner_limits(self):
+        self.request_runner = RequestRunner(deadline=0.1, attempt_timeout=0.05, max_retries=0)
+        attempts = []
+
+        def request(timeout):
+            attempts.append(timeout)
+            time.sleep(0.2)
+            return 'transcript'
+
+        self.assertEqual('transcript', self.request_runner.run(request, deadline=5, attempt_timeout=2))
+        self.assertGreater(attempts[0], 1)
+
+    def test_hedged_request_answers_when_first_is_slow(self):
+        self.request_runner = RequestRunner(deadline=5, hedge_percentile=95, hedge_min_samples=3)
+        self.request_runner.attempt_latencies.extend([0.05, 0.05, 0.05])
+        release = threading.Event()
+        attempts = []
+
+        def request(timeout):
+            attempts.append(timeout)
+            if len(attempts) == 1:
+                release.wait(5)
+                return 'slow'
+            return 'hedged'
+
+        start = time.monotonic()
+        self.assertEqual('hedged', self.request_runner.run(request))
+        release.set()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        stats = self.request_runner.get_stats()
+        self.assertEqual((1, 1), (stats['hedges'], stats['hedge_wins']))
+
+
+if __name__ == '__main__':
+    unittest.main()
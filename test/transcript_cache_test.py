@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+from deepgram import PrerecordedOptions
+
+from data.remote_data_source.transcript_cache import TranscriptCache
+
+
+class TestTranscriptCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.options = PrerecordedOptions(model="nova", punctuate=True)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_miss_then_hit(self):
+        cache = TranscriptCache(self.directory)
+        key = cache.create_key(b'audio', self.options)
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {'metadata': {'request_id': '1'}})
+
+        self.assertEqual({'metadata': {'request_id': '1'}}, cache.get(key))
+        stats = cache.get_stats()
+        self.assertEqual((1, 1, 1), (stats['hits'], stats['misses'], stats['entries']))
+
+    def test_key_depends_on_audio_and_options(self):
+        key = TranscriptCache.create_key(b'audio', self.options)
+
+        self.assertEqual(key, TranscriptCache.create_key(b'audio', PrerecordedOptions(punctuate=True, model="nova")))
+        self.assertNotEqual(key, TranscriptCache.create_key(b'other audio', self.options))
+        self.assertNotEqual(key, TranscriptCache.create_key(b'audio', PrerecordedOptions(model="nova")))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        entry_size = len(b'{"text": "0000000000"}')
+        cache = TranscriptCache(self.directory, max_bytes=2 * entry_size)
+
+        cache.put('first', {'text': '0000000000'})
+        cache.put('second', {'text': '1111111111'})
+        cache.get('first')
+        cache.put('third', {'text': '2222222222'})
+
+        self.assertIsNone(cache.get('second'))
+        self.assertIsNotNone(cache.get('first'))
+        self.assertIsNotNone(cache.get('third'))
+        self.assertFalse(os.path.exists(cache.entry_path('second')))
+        self.assertEqual(2 * entry_size, cache.get_stats()['bytes'])
+
+    def test_entries_persist_across_instances(self):
+        TranscriptCache(self.directory).put('key', {'text': 'hello'})
+
+        cache = TranscriptCache(self.directory)
+
+        self.assertEqual({'text': 'hello'}, cache.get('key'))
+        self.assertEqual(1, cache.get_stats()['entries'])
+
+
+if __name__ == '__main__':
+    unittest.main()
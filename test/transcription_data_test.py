@@ -0,0 +1,26 @@
+import copy
+import pickle
+
+from benchmark.deepgram_stub_server import create_recorded_response
+from data.model.input_models.transcription_data import JSONResponse, Word
+
+
+def test_words_are_parsed_on_first_access():
+    transcript = JSONResponse(**create_recorded_response(['hello', 'big', 'world']))
+    alternative = transcript.results.channels[0].alternatives[0]
+
+    assert alternative._words is None
+    assert [word.word for word in alternative.words] == ['hello', 'big', 'world']
+    assert alternative.words is alternative.words
+    assert alternative._paragraphs is None
+    assert alternative.paragraphs.paragraphs[0].sentences[0].text == 'Hello Big World'
+
+
+def test_slotted_words_copy_and_pickle():
+    word = Word('hello', 0.5, 1.0, 0.9, 'Hello', 0, 0.8)
+    shifted = copy.copy(word)
+    shifted.start += 1
+
+    assert not hasattr(word, '__dict__')
+    assert word.start == 0.5
+    assert pickle.loads(pickle.dumps(word)).to_dict() == word.to_dict()
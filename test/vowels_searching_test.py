@@ -1,6 +1,7 @@
 import os
 
 import librosa
+import numpy as np
 import pytest
 
 from service.vowels_detection_service import VowelsDetectionService
@@ -127,3 +128,62 @@ def test_vowels_count(path, count, word):
     # plot_signal_with_highlighted_timeranges(signal, sr, vowel_segments, f'expected vowel count: {count}, word: {word}')
 
     assert len(vowel_segments) == count
+
+
+@pytest.mark.parametrize("path, count, word", vowels_audio_expected_vowels_count)
+def test_mask_engine_matches_loop_engine(path, count, word):
+    loop_service = VowelsDetectionService(engine=VowelsDetectionService.LOOP_ENGINE)
+    mask_service = VowelsDetectionService(engine=VowelsDetectionService.MASK_ENGINE)
+    signal, sr = librosa.load(path, sr=None)
+
+    assert mask_service.find_vowels(signal, sr) == loop_service.find_vowels(signal, sr)
+
+
+def detect_in_chunks(signal, sr, chunk_size, warmup_frames=50):
+    stream_detector = VowelsDetectionService().create_stream_detector(sr, warmup_frames=warmup_frames)
+
+    vowel_segments = []
+    for start in range(0, len(signal), chunk_size):
+        vowel_segments += stream_detector.push(signal[start:start + chunk_size])
+    vowel_segments += stream_detector.flush()
+
+    return vowel_segments
+
+
+@pytest.mark.parametrize("path, count, word", vowels_audio_expected_vowels_count[:10])
+def test_streaming_does_not_depend_on_chunk_size(path, count, word):
+    signal, sr = librosa.load(path, sr=None)
+
+    whole_signal_segments = detect_in_chunks(signal, sr, len(signal))
+
+    assert detect_in_chunks(signal, sr, 1000) == whole_signal_segments
+    assert detect_in_chunks(signal, sr, 4410) == whole_signal_segments
+
+
+@pytest.mark.parametrize("path, count, word", vowels_audio_expected_vowels_count)
+def test_streaming_with_full_warmup_matches_batch_count(path, count, word):
+    signal, sr = librosa.load(path, sr=None)
+
+    vowel_segments = detect_in_chunks(signal, sr, 1000, warmup_frames=len(signal))
+
+    assert len(vowel_segments) == len(VowelsDetectionService().find_vowels(signal, sr))
+
+
+def test_find_vowels_for_spans_matches_per_word_detection():
+    vowels_service = VowelsDetectionService()
+
+    signals = []
+    spans = []
+    position = 0
+    for path, _, _ in vowels_audio_expected_vowels_count[:10]:
+        signal, sr = librosa.load(path, sr=None)
+        spans.append((position / sr, (position + len(signal)) / sr))
+        signals.append(signal)
+        position += len(signal)
+    utterance = np.concatenate(signals)
+
+    vowels_per_word = vowels_service.find_vowels_for_spans(utterance, sr, spans)
+
+    for (start, end), word_vowels in zip(spans, vowels_per_word):
+        segment = utterance[int(start * sr):int(end * sr)]
+        assert word_vowels == vowels_service.find_vowels(segment, sr)
@@ -1,5 +1,7 @@
 import json
+import os
 
+import numpy as np
 from pydub import AudioSegment
 
 from data.model.output_models.time_range import TimeRange
@@ -25,11 +27,59 @@ class FileDataManager:
         with open(filepath, 'w') as file:
             json.dump(words_dicts, file, indent=4)
 
+    @staticmethod
+    def save_pauses_to_file(pauses, filepath):
+        with open(filepath, 'w') as file:
+            json.dump(pauses, file)
+
+    @staticmethod
+    def load_pauses_from_file(filepath):
+        with open(filepath, 'r') as file:
+            return json.load(file)
+
+    @staticmethod
+    def save_ingest_timings_to_file(timings, filepath):
+        with open(filepath, 'w') as file:
+            json.dump(timings, file, indent=4)
+
+    @staticmethod
+    def load_ingest_timings_from_file(filepath):
+        with open(filepath, 'r') as file:
+            return json.load(file)
+
     @staticmethod
     def save_time_range_to_file(time_range, filepath):
         with open(filepath, 'w') as file:
             json.dump(time_range, file, indent=4)
 
+    @staticmethod
+    def save_pitch_track(times, f0, filepath):
+        temporary_filepath = filepath + '.tmp'
+        with open(temporary_filepath, 'wb') as file:
+            np.savez(file, times=times.astype(np.float32), f0=f0.astype(np.float32))
+        os.replace(temporary_filepath, filepath)
+
+    @staticmethod
+    def load_pitch_track(filepath):
+        with np.load(filepath) as pitch_track:
+            return pitch_track['times'], pitch_track['f0']
+
+    @staticmethod
+    def save_analysis_audio(audio, filepath):
+        with open(filepath, 'wb') as file:
+            np.save(file, np.asarray(audio, dtype=np.float32))
+
+    @staticmethod
+    def load_analysis_audio_segment(filepath, sample_rate, start_in_seconds, end_in_seconds):
+        audio = np.load(filepath, mmap_mode='r')
+        start_sample = int(start_in_seconds * sample_rate)
+        end_sample = int(end_in_seconds * sample_rate)
+        return np.array(audio[start_sample:end_sample])
+
+    @staticmethod
+    def load_analysis_audio(filepath):
+        return np.load(filepath, mmap_mode='r')
+
     @staticmethod
     def save_audio_to_wav(uint8list_data, output_path):
         try: